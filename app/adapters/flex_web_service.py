@@ -8,6 +8,7 @@ import time
 from dataclasses import dataclass
 from typing import Callable, Final
 import xml.etree.ElementTree as element_tree
+from xml.parsers import expat
 
 import httpx
 
@@ -32,6 +33,84 @@ from .flex_errors import (
 from .interfaces import AdapterFetchResult, FlexAdapterPort
 
 
+class _AdapterPollStatementProbe:
+    """Expat handlers classifying a poll payload root and its direct children."""
+
+    def __init__(self, parser: expat.XMLParserType) -> None:
+        """Attach element handlers to the given expat parser.
+
+        Args:
+            parser: Expat parser that will receive the poll payload.
+
+        Returns:
+            None: Initializer does not return a value.
+
+        Raises:
+            RuntimeError: This initializer does not raise runtime errors.
+        """
+
+        self.is_statement = False
+        self._parser = parser
+        self._depth = 0
+        parser.StartElementHandler = self.start
+        parser.EndElementHandler = self.end
+
+    def start(self, tag: str, _attributes: dict[str, str]) -> None:
+        """Classify one opening element at root or direct-child depth.
+
+        Args:
+            tag: Element tag name.
+            _attributes: Element attributes, unused.
+
+        Returns:
+            None: State is updated as side effect.
+
+        Raises:
+            RuntimeError: This method does not raise runtime errors.
+        """
+
+        self._depth += 1
+        if self._depth == 1:
+            if tag == "FlexStatements":
+                self._settle(is_statement=True)
+            elif tag != "FlexQueryResponse":
+                self._settle(is_statement=False)
+        elif self._depth == 2 and tag == "FlexStatements":
+            self._settle(is_statement=True)
+
+    def end(self, _tag: str) -> None:
+        """Track one closing element.
+
+        Args:
+            _tag: Element tag name, unused.
+
+        Returns:
+            None: State is updated as side effect.
+
+        Raises:
+            RuntimeError: This method does not raise runtime errors.
+        """
+
+        self._depth -= 1
+
+    def _settle(self, is_statement: bool) -> None:
+        """Record the classification and detach handlers for the rest of the payload.
+
+        Args:
+            is_statement: Whether the payload is a statement document.
+
+        Returns:
+            None: State is updated as side effect.
+
+        Raises:
+            RuntimeError: This method does not raise runtime errors.
+        """
+
+        self.is_statement = is_statement
+        self._parser.StartElementHandler = None
+        self._parser.EndElementHandler = None
+
+
 @dataclass(frozen=True)
 class _AdapterRetryStrategy:
     """Immutable retry strategy config and calculation helpers.
@@ -336,24 +415,24 @@ class FlexWebServiceAdapter(FlexAdapterPort):
                 time.sleep(wait_seconds)
 
             poll_payload = self._adapter_http_get(url=statement_url, query_parameters=query_parameters)
-            poll_root = self._adapter_try_parse_xml(payload=poll_payload)
-            if poll_root is None:
-                if not poll_payload:
-                    continue
+            if self._adapter_poll_payload_is_statement_xml(payload=poll_payload):
                 self._adapter_record_stage_event(
                     stage_timeline=stage_timeline,
                     stage="download",
                     status="completed",
-                        details={"poll_attempt": retry_index + 1, "payload_format": "non_xml"},
+                    details={"poll_attempt": retry_index + 1},
                 )
                 return poll_payload
 
-            if self._adapter_poll_payload_is_statement_xml(poll_root):
+            poll_root = self._adapter_try_parse_xml(payload=poll_payload)
+            if poll_root is None:
+                if not poll_payload:
+                    continue
                 self._adapter_record_stage_event(
                     stage_timeline=stage_timeline,
                     stage="download",
                     status="completed",
-                    details={"poll_attempt": retry_index + 1},
+                        details={"poll_attempt": retry_index + 1, "payload_format": "non_xml"},
                 )
                 return poll_payload
 
@@ -424,22 +503,33 @@ class FlexWebServiceAdapter(FlexAdapterPort):
 
         raise FlexAdapterTimeoutError("Flex transport request timed out")
 
-    def _adapter_poll_payload_is_statement_xml(self, poll_root: element_tree.Element) -> bool:
-        """Return whether poll response root contains a Flex statement payload.
+    def _adapter_poll_payload_is_statement_xml(self, payload: bytes) -> bool:
+        """Return whether poll payload is a well-formed Flex statement document.
+
+        Only the root and its direct children are inspected in Python. Once they settle
+        the question the probe detaches, and expat checks the rest of the payload for
+        well-formedness without building a tree. Malformed payloads return False so the
+        caller's full-parse path classifies them and records their diagnostics.
 
         Args:
-            poll_root: Parsed poll XML root node.
+            payload: Poll response payload.
 
         Returns:
-            bool: True when poll payload is a statement document.
+            bool: True when the payload is well-formed and its root is `FlexStatements`, or
+            `FlexQueryResponse` with a direct `FlexStatements` child.
 
         Raises:
             RuntimeError: This helper does not raise runtime errors.
         """
 
-        if poll_root.tag == "FlexQueryResponse":
-            return poll_root.find("FlexStatements") is not None
-        return poll_root.tag == "FlexStatements"
+        # The separator keeps namespaced tags distinct from bare names, as in ElementTree.
+        parser = expat.ParserCreate(namespace_separator="}")
+        statement_probe = _AdapterPollStatementProbe(parser=parser)
+        try:
+            parser.Parse(payload, True)
+        except expat.ExpatError:
+            return False
+        return statement_probe.is_statement
 
     def _adapter_extract_response_error(
         self,
@@ -42,6 +42,8 @@ def api_create_ingestion_router(
 
     router = APIRouter(prefix="/ingestion", tags=["ingestion"])
 
+    # Trigger handlers stay plain `def`: FastAPI runs them on its worker threadpool, so the blocking
+    # Flex fetch and DB writes never stall the event loop serving reads.
     @router.post("/run")
     def api_ingestion_run_trigger() -> JSONResponse:
         """Trigger one ingestion run via orchestrator.
@@ -3,9 +3,10 @@
 from datetime import datetime, timezone
 
 from fastapi import FastAPI
+from sqlalchemy import Engine
 
 from app.api import create_api_application
-from app.config import config_load_settings
+from app.config import AppSettings, config_load_settings
 from app.adapters import FlexWebServiceAdapter
 from app.db import (
     SQLAlchemyCanonicalPersistenceService,
@@ -13,7 +14,7 @@ from app.db import (
     SQLAlchemyIngestionRunService,
     SQLAlchemyLedgerSnapshotService,
     SQLAlchemyRawPersistenceService,
-    db_create_engine,
+    db_create_engine_from_settings,
 )
 from app.jobs import (
     CanonicalReprocessOrchestrator,
@@ -35,35 +36,17 @@ def bootstrap_create_application() -> FastAPI:
     """
 
     settings = config_load_settings()
-    engine = db_create_engine(database_url=settings.database_url)
+    engine = db_create_engine_from_settings(settings)
     db_health_service = SQLAlchemyDatabaseHealthService(engine=engine)
     ingestion_repository = SQLAlchemyIngestionRunService(engine=engine)
-    raw_persistence_repository = SQLAlchemyRawPersistenceService(engine=engine)
     canonical_repository = SQLAlchemyCanonicalPersistenceService(engine=engine)
     snapshot_repository = SQLAlchemyLedgerSnapshotService(engine=engine)
-    snapshot_service = StockLedgerSnapshotService(repository=snapshot_repository)
-    flex_adapter = FlexWebServiceAdapter(
-        token=settings.ibkr_flex_token,
-        initial_wait_seconds=settings.ibkr_flex_initial_wait_seconds,
-        retry_attempts=settings.ibkr_flex_retry_attempts,
-        retry_backoff_base_seconds=settings.ibkr_flex_backoff_base_seconds,
-        retry_max_backoff_seconds=settings.ibkr_flex_backoff_max_seconds,
-        jitter_min_multiplier=settings.ibkr_flex_jitter_min_multiplier,
-        jitter_max_multiplier=settings.ibkr_flex_jitter_max_multiplier,
-    )
-    ingestion_orchestrator = IngestionJobOrchestrator(
+    ingestion_orchestrator = _bootstrap_build_ingestion_orchestrator(
+        settings=settings,
+        engine=engine,
         ingestion_repository=ingestion_repository,
-        raw_persistence_repository=raw_persistence_repository,
-        flex_adapter=flex_adapter,
-        config=IngestionOrchestratorConfig(
-            account_id=settings.account_id,
-            flex_query_id=settings.ibkr_flex_query_id,
-            run_type="manual",
-            reconciliation_enabled=False,
-            functional_currency="USD",
-        ),
         canonical_repository=canonical_repository,
-        snapshot_service=snapshot_service,
+        snapshot_repository=snapshot_repository,
     )
     reprocess_orchestrator = CanonicalReprocessOrchestrator(
         raw_read_repository=canonical_repository,
@@ -97,34 +80,13 @@ def bootstrap_create_ingestion_orchestrator() -> IngestionJobOrchestrator:
     """
 
     settings = config_load_settings()
-    engine = db_create_engine(database_url=settings.database_url)
-    ingestion_repository = SQLAlchemyIngestionRunService(engine=engine)
-    raw_persistence_repository = SQLAlchemyRawPersistenceService(engine=engine)
-    canonical_repository = SQLAlchemyCanonicalPersistenceService(engine=engine)
-    snapshot_repository = SQLAlchemyLedgerSnapshotService(engine=engine)
-    snapshot_service = StockLedgerSnapshotService(repository=snapshot_repository)
-    flex_adapter = FlexWebServiceAdapter(
-        token=settings.ibkr_flex_token,
-        initial_wait_seconds=settings.ibkr_flex_initial_wait_seconds,
-        retry_attempts=settings.ibkr_flex_retry_attempts,
-        retry_backoff_base_seconds=settings.ibkr_flex_backoff_base_seconds,
-        retry_max_backoff_seconds=settings.ibkr_flex_backoff_max_seconds,
-        jitter_min_multiplier=settings.ibkr_flex_jitter_min_multiplier,
-        jitter_max_multiplier=settings.ibkr_flex_jitter_max_multiplier,
-    )
-    return IngestionJobOrchestrator(
-        ingestion_repository=ingestion_repository,
-        raw_persistence_repository=raw_persistence_repository,
-        flex_adapter=flex_adapter,
-        config=IngestionOrchestratorConfig(
-            account_id=settings.account_id,
-            flex_query_id=settings.ibkr_flex_query_id,
-            run_type="manual",
-            reconciliation_enabled=False,
-            functional_currency="USD",
-        ),
-        canonical_repository=canonical_repository,
-        snapshot_service=snapshot_service,
+    engine = db_create_engine_from_settings(settings)
+    return _bootstrap_build_ingestion_orchestrator(
+        settings=settings,
+        engine=engine,
+        ingestion_repository=SQLAlchemyIngestionRunService(engine=engine),
+        canonical_repository=SQLAlchemyCanonicalPersistenceService(engine=engine),
+        snapshot_repository=SQLAlchemyLedgerSnapshotService(engine=engine),
     )
 
 
@@ -144,7 +106,7 @@ def bootstrap_create_reprocess_orchestrator(
     settings = config_load_settings()
     resolved_period_key = (period_key or datetime.now(timezone.utc).date().isoformat()).strip()
     resolved_flex_query_id = (flex_query_id or settings.ibkr_flex_query_id).strip()
-    engine = db_create_engine(database_url=settings.database_url)
+    engine = db_create_engine_from_settings(settings)
     ingestion_repository = SQLAlchemyIngestionRunService(engine=engine)
     canonical_repository = SQLAlchemyCanonicalPersistenceService(engine=engine)
     return CanonicalReprocessOrchestrator(
@@ -158,3 +120,51 @@ def bootstrap_create_reprocess_orchestrator(
             functional_currency="USD",
         ),
     )
+
+
+def _bootstrap_build_ingestion_orchestrator(
+    settings: AppSettings,
+    engine: Engine,
+    ingestion_repository: SQLAlchemyIngestionRunService,
+    canonical_repository: SQLAlchemyCanonicalPersistenceService,
+    snapshot_repository: SQLAlchemyLedgerSnapshotService,
+) -> IngestionJobOrchestrator:
+    """Wire the ingestion orchestrator shared by the HTTP and non-HTTP trigger surfaces.
+
+    Args:
+        settings: Validated runtime settings.
+        engine: Shared SQLAlchemy engine for the raw persistence service.
+        ingestion_repository: Ingestion run persistence service.
+        canonical_repository: Canonical persistence and raw read service.
+        snapshot_repository: Ledger snapshot persistence service.
+
+    Returns:
+        IngestionJobOrchestrator: Fully wired ingestion orchestrator instance.
+
+    Raises:
+        ValueError: Raised when orchestrator dependencies or config values are invalid.
+    """
+
+    flex_adapter = FlexWebServiceAdapter(
+        token=settings.ibkr_flex_token,
+        initial_wait_seconds=settings.ibkr_flex_initial_wait_seconds,
+        retry_attempts=settings.ibkr_flex_retry_attempts,
+        retry_backoff_base_seconds=settings.ibkr_flex_backoff_base_seconds,
+        retry_max_backoff_seconds=settings.ibkr_flex_backoff_max_seconds,
+        jitter_min_multiplier=settings.ibkr_flex_jitter_min_multiplier,
+        jitter_max_multiplier=settings.ibkr_flex_jitter_max_multiplier,
+    )
+    return IngestionJobOrchestrator(
+        ingestion_repository=ingestion_repository,
+        raw_persistence_repository=SQLAlchemyRawPersistenceService(engine=engine),
+        flex_adapter=flex_adapter,
+        config=IngestionOrchestratorConfig(
+            account_id=settings.account_id,
+            flex_query_id=settings.ibkr_flex_query_id,
+            run_type="manual",
+            reconciliation_enabled=False,
+            functional_currency="USD",
+        ),
+        canonical_repository=canonical_repository,
+        snapshot_service=StockLedgerSnapshotService(repository=snapshot_repository),
+    )
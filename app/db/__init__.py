@@ -32,11 +32,13 @@ from .interfaces import (
 	RawArtifactPersistResult,
 	RawArtifactRecord,
 	RawArtifactReference,
+	RawArtifactWithRecordsPersistResult,
 	RawPersistenceRepositoryPort,
+	RawRecordDraft,
 	RawRecordPersistRequest,
 	RawRecordPersistResult,
 )
-from .session import db_create_engine, db_create_session_factory
+from .session import db_create_engine, db_create_engine_from_settings, db_create_session_factory
 
 __all__ = [
 	"DatabaseHealthPort",
@@ -66,6 +68,8 @@ __all__ = [
 	"RawArtifactPersistRequest",
 	"RawArtifactRecord",
 	"RawArtifactPersistResult",
+	"RawArtifactWithRecordsPersistResult",
+	"RawRecordDraft",
 	"RawRecordPersistRequest",
 	"RawRecordPersistResult",
 	"SQLAlchemyDatabaseHealthService",
@@ -74,5 +78,6 @@ __all__ = [
 	"SQLAlchemyRawPersistenceService",
 	"SQLAlchemyLedgerSnapshotService",
 	"db_create_engine",
+	"db_create_engine_from_settings",
 	"db_create_session_factory",
 ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
 from uuid import UUID
 
@@ -19,6 +20,7 @@ from app.db.interfaces import (
     RawRecordForCanonicalMapping,
     RawRecordReadRepositoryPort,
 )
+from app.db.validation import db_validate_non_empty_text
 
 
 class SQLAlchemyCanonicalPersistenceService(CanonicalPersistenceRepositoryPort, RawRecordReadRepositoryPort):
@@ -39,6 +41,123 @@ class SQLAlchemyCanonicalPersistenceService(CanonicalPersistenceRepositoryPort,
         + "WHERE ingestion_run_id = CAST(:ingestion_run_id AS uuid) "
         + "ORDER BY created_at_utc ASC, raw_record_id ASC"
     )
+    # Compact, non-ASCII-escaping encoder; recordset rows are freshly built dicts with no cycles.
+    _RECORDSET_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, check_circular=False, separators=(",", ":"))
+    _SQL_INSTRUMENT_UPSERT_FROM_RECORDSET = text(
+        "INSERT INTO instrument ("
+        "account_id, conid, symbol, local_symbol, isin, cusip, figi, asset_category, currency, description"
+        ") SELECT "
+        "r.account_id, r.conid, r.symbol, r.local_symbol, r.isin, r.cusip, r.figi, r.asset_category, r.currency, r.description "
+        "FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS r("
+        "account_id text, conid text, symbol text, local_symbol text, isin text, cusip text, figi text, "
+        "asset_category text, currency text, description text"
+        ") ON CONFLICT (account_id, conid) DO UPDATE SET "
+        "symbol = EXCLUDED.symbol, "
+        "local_symbol = COALESCE(EXCLUDED.local_symbol, instrument.local_symbol), "
+        "isin = COALESCE(EXCLUDED.isin, instrument.isin), "
+        "cusip = COALESCE(EXCLUDED.cusip, instrument.cusip), "
+        "figi = COALESCE(EXCLUDED.figi, instrument.figi), "
+        "asset_category = EXCLUDED.asset_category, "
+        "currency = EXCLUDED.currency, "
+        "description = COALESCE(EXCLUDED.description, instrument.description), "
+        "updated_at_utc = now() "
+        "RETURNING instrument_id, account_id, conid"
+    )
+    # Event upserts share one transaction in db_canonical_bulk_upsert; statements are
+    # built once so the held connection only spends time on executemany round-trips.
+    _SQL_TRADE_FILL_UPSERT = text(
+        "INSERT INTO event_trade_fill ("
+        "account_id, instrument_id, ingestion_run_id, source_raw_record_id, ib_exec_id, transaction_id, "
+        "trade_timestamp_utc, report_date_local, side, quantity, price, cost, commission, fees, "
+        "realized_pnl, net_cash, net_cash_in_base, fx_rate_to_base, currency, functional_currency"
+        ") VALUES ("
+        ":account_id, CAST(:instrument_id AS uuid), CAST(:ingestion_run_id AS uuid), "
+        "CAST(:source_raw_record_id AS uuid), :ib_exec_id, :transaction_id, "
+        "CAST(:trade_timestamp_utc AS timestamptz), CAST(:report_date_local AS date), :side, "
+        "CAST(:quantity AS numeric), CAST(:price AS numeric), CAST(:cost AS numeric), "
+        "CAST(:commission AS numeric), CAST(:fees AS numeric), CAST(:realized_pnl AS numeric), "
+        "CAST(:net_cash AS numeric), CAST(:net_cash_in_base AS numeric), "
+        "CAST(:fx_rate_to_base AS numeric), :currency, :functional_currency"
+        ") ON CONFLICT ON CONSTRAINT uq_event_trade_fill_account_exec DO UPDATE SET "
+        "commission = EXCLUDED.commission, "
+        "realized_pnl = EXCLUDED.realized_pnl, "
+        "net_cash = EXCLUDED.net_cash, "
+        "cost = EXCLUDED.cost"
+    )
+    _SQL_CASHFLOW_UPSERT = text(
+        "INSERT INTO event_cashflow ("
+        "account_id, instrument_id, ingestion_run_id, source_raw_record_id, transaction_id, cash_action, "
+        "report_date_local, effective_at_utc, amount, amount_in_base, currency, functional_currency, "
+        "withholding_tax, fees, is_correction"
+        ") VALUES ("
+        ":account_id, CAST(:instrument_id AS uuid), CAST(:ingestion_run_id AS uuid), "
+        "CAST(:source_raw_record_id AS uuid), :transaction_id, :cash_action, "
+        "CAST(:report_date_local AS date), CAST(:effective_at_utc AS timestamptz), "
+        "CAST(:amount AS numeric), CAST(:amount_in_base AS numeric), :currency, :functional_currency, "
+        "CAST(:withholding_tax AS numeric), CAST(:fees AS numeric), false"
+        ") ON CONFLICT ON CONSTRAINT uq_event_cashflow_account_txn_action_ccy DO UPDATE SET "
+        "ingestion_run_id = EXCLUDED.ingestion_run_id, "
+        "source_raw_record_id = EXCLUDED.source_raw_record_id, "
+        "instrument_id = COALESCE(EXCLUDED.instrument_id, event_cashflow.instrument_id), "
+        "report_date_local = EXCLUDED.report_date_local, "
+        "effective_at_utc = EXCLUDED.effective_at_utc, "
+        "amount = EXCLUDED.amount, "
+        "amount_in_base = EXCLUDED.amount_in_base, "
+        "withholding_tax = EXCLUDED.withholding_tax, "
+        "fees = EXCLUDED.fees, "
+        "is_correction = event_cashflow.is_correction "
+        "OR event_cashflow.amount IS DISTINCT FROM EXCLUDED.amount "
+        "OR event_cashflow.report_date_local IS DISTINCT FROM EXCLUDED.report_date_local"
+    )
+    _SQL_FX_UPSERT = text(
+        "INSERT INTO event_fx ("
+        "account_id, ingestion_run_id, source_raw_record_id, transaction_id, report_date_local, currency, "
+        "functional_currency, fx_rate, fx_source, provisional, diagnostic_code"
+        ") VALUES ("
+        ":account_id, CAST(:ingestion_run_id AS uuid), CAST(:source_raw_record_id AS uuid), :transaction_id, "
+        "CAST(:report_date_local AS date), :currency, :functional_currency, "
+        "CAST(:fx_rate AS numeric), :fx_source, :provisional, :diagnostic_code"
+        ") ON CONFLICT ON CONSTRAINT uq_event_fx_account_txn_ccy_pair DO UPDATE SET "
+        "report_date_local = EXCLUDED.report_date_local, "
+        "fx_rate = EXCLUDED.fx_rate, "
+        "fx_source = EXCLUDED.fx_source, "
+        "provisional = EXCLUDED.provisional, "
+        "diagnostic_code = EXCLUDED.diagnostic_code"
+    )
+    _SQL_CORP_ACTION_FALLBACK_UPSERT = text(
+        "INSERT INTO event_corp_action ("
+        "account_id, instrument_id, conid, ingestion_run_id, source_raw_record_id, action_id, "
+        "transaction_id, reorg_code, report_date_local, description, requires_manual, provisional, manual_case_id"
+        ") VALUES ("
+        ":account_id, CAST(:instrument_id AS uuid), :conid, CAST(:ingestion_run_id AS uuid), "
+        "CAST(:source_raw_record_id AS uuid), :action_id, :transaction_id, :reorg_code, "
+        "CAST(:report_date_local AS date), :description, :requires_manual, :provisional, "
+        "CAST(:manual_case_id AS uuid)"
+        ") ON CONFLICT ON CONSTRAINT uq_event_corp_action_fallback DO UPDATE SET "
+        "requires_manual = true, "
+        "provisional = true, "
+        "description = COALESCE(EXCLUDED.description, event_corp_action.description), "
+        "manual_case_id = COALESCE(event_corp_action.manual_case_id, EXCLUDED.manual_case_id)"
+    )
+    _SQL_CORP_ACTION_BY_ACTION_ID_UPSERT = text(
+        "INSERT INTO event_corp_action ("
+        "account_id, instrument_id, conid, ingestion_run_id, source_raw_record_id, action_id, "
+        "transaction_id, reorg_code, report_date_local, description, requires_manual, provisional, manual_case_id"
+        ") VALUES ("
+        ":account_id, CAST(:instrument_id AS uuid), :conid, CAST(:ingestion_run_id AS uuid), "
+        "CAST(:source_raw_record_id AS uuid), :action_id, :transaction_id, :reorg_code, "
+        "CAST(:report_date_local AS date), :description, :requires_manual, :provisional, "
+        "CAST(:manual_case_id AS uuid)"
+        ") ON CONFLICT ON CONSTRAINT uq_event_corp_action_account_action DO UPDATE SET "
+        "instrument_id = COALESCE(EXCLUDED.instrument_id, event_corp_action.instrument_id), "
+        "transaction_id = COALESCE(EXCLUDED.transaction_id, event_corp_action.transaction_id), "
+        "reorg_code = EXCLUDED.reorg_code, "
+        "report_date_local = EXCLUDED.report_date_local, "
+        "description = COALESCE(EXCLUDED.description, event_corp_action.description), "
+        "requires_manual = EXCLUDED.requires_manual, "
+        "provisional = EXCLUDED.provisional, "
+        "manual_case_id = COALESCE(EXCLUDED.manual_case_id, event_corp_action.manual_case_id)"
+    )
 
     def __init__(self, engine: Engine):
         """Initialize canonical persistence service.
@@ -128,49 +247,71 @@ class SQLAlchemyCanonicalPersistenceService(CanonicalPersistenceRepositoryPort,
             RuntimeError: Raised when persistence operation fails.
         """
 
-        normalized_request = self._db_canonical_validate_instrument_request(request)
+        return self.db_canonical_instruments_bulk_upsert([request])[0]
+
+    def db_canonical_instruments_bulk_upsert(
+        self,
+        requests: list[CanonicalInstrumentUpsertRequest],
+    ) -> list[CanonicalInstrumentRecord]:
+        """Persist or reuse canonical instruments by conid-first identity in one statement.
+
+        Duplicate conids within one batch are collapsed with last-request-wins
+        semantics because one UPSERT statement cannot update the same row twice.
+
+        Args:
+            requests: Instrument upsert requests.
+
+        Returns:
+            list[CanonicalInstrumentRecord]: Persisted canonical instrument records, one per unique conid.
+
+        Raises:
+            ValueError: Raised when request values are invalid.
+            RuntimeError: Raised when persistence operation fails.
+        """
+
+        if requests is None:
+            raise ValueError("requests must not be None")
+
+        normalized_requests_by_conid: dict[str, CanonicalInstrumentUpsertRequest] = {}
+        for request in requests:
+            normalized_request = self._db_canonical_validate_instrument_request(request)
+            normalized_requests_by_conid[normalized_request.conid] = normalized_request
+        if not normalized_requests_by_conid:
+            return []
+
+        recordset_rows = [
+            {
+                "account_id": normalized_request.account_id,
+                "conid": normalized_request.conid,
+                "symbol": normalized_request.symbol,
+                "local_symbol": normalized_request.local_symbol,
+                "isin": normalized_request.isin,
+                "cusip": normalized_request.cusip,
+                "figi": normalized_request.figi,
+                "asset_category": normalized_request.asset_category,
+                "currency": normalized_request.currency,
+                "description": normalized_request.description,
+            }
+            for normalized_request in normalized_requests_by_conid.values()
+        ]
+        recordset_json = self._RECORDSET_JSON_ENCODER.encode(recordset_rows)
 
         try:
             with self._engine.begin() as connection:
-                row = connection.execute(
-                    text(
-                        "INSERT INTO instrument ("
-                        "account_id, conid, symbol, local_symbol, isin, cusip, figi, asset_category, currency, description"
-                        ") VALUES ("
-                        ":account_id, :conid, :symbol, :local_symbol, :isin, :cusip, :figi, :asset_category, :currency, :description"
-                        ") ON CONFLICT (account_id, conid) DO UPDATE SET "
-                        "symbol = EXCLUDED.symbol, "
-                        "local_symbol = COALESCE(EXCLUDED.local_symbol, instrument.local_symbol), "
-                        "isin = COALESCE(EXCLUDED.isin, instrument.isin), "
-                        "cusip = COALESCE(EXCLUDED.cusip, instrument.cusip), "
-                        "figi = COALESCE(EXCLUDED.figi, instrument.figi), "
-                        "asset_category = EXCLUDED.asset_category, "
-                        "currency = EXCLUDED.currency, "
-                        "description = COALESCE(EXCLUDED.description, instrument.description), "
-                        "updated_at_utc = now() "
-                        "RETURNING instrument_id, account_id, conid"
-                    ),
-                    {
-                        "account_id": normalized_request.account_id,
-                        "conid": normalized_request.conid,
-                        "symbol": normalized_request.symbol,
-                        "local_symbol": normalized_request.local_symbol,
-                        "isin": normalized_request.isin,
-                        "cusip": normalized_request.cusip,
-                        "figi": normalized_request.figi,
-                        "asset_category": normalized_request.asset_category,
-                        "currency": normalized_request.currency,
-                        "description": normalized_request.description,
-                    },
-                ).mappings().one()
+                rows = connection.execute(
+                    self._SQL_INSTRUMENT_UPSERT_FROM_RECORDSET,
+                    {"rows": recordset_json},
+                ).all()
         except SQLAlchemyError as error:
             raise RuntimeError("canonical instrument upsert failed") from error
 
-        return CanonicalInstrumentRecord(
-            instrument_id=row["instrument_id"],
-            account_id=row["account_id"],
-            conid=row["conid"],
-        )
+        if len(rows) != len(recordset_rows):
+            raise RuntimeError("canonical instrument upsert returned unexpected row count")
+
+        return [
+            CanonicalInstrumentRecord(instrument_id=instrument_id, account_id=account_id, conid=conid)
+            for instrument_id, account_id, conid in rows
+        ]
 
     def db_canonical_trade_fill_upsert(self, request: CanonicalTradeFillUpsertRequest) -> None:
         """UPSERT one canonical trade-fill event by frozen natural key.
@@ -298,122 +439,19 @@ class SQLAlchemyCanonicalPersistenceService(CanonicalPersistenceRepositoryPort,
         try:
             with self._engine.begin() as connection:
                 if normalized_trade_requests:
-                    connection.execute(
-                        text(
-                            "INSERT INTO event_trade_fill ("
-                            "account_id, instrument_id, ingestion_run_id, source_raw_record_id, ib_exec_id, transaction_id, "
-                            "trade_timestamp_utc, report_date_local, side, quantity, price, cost, commission, fees, "
-                            "realized_pnl, net_cash, net_cash_in_base, fx_rate_to_base, currency, functional_currency"
-                            ") VALUES ("
-                            ":account_id, CAST(:instrument_id AS uuid), CAST(:ingestion_run_id AS uuid), "
-                            "CAST(:source_raw_record_id AS uuid), :ib_exec_id, :transaction_id, "
-                            "CAST(:trade_timestamp_utc AS timestamptz), CAST(:report_date_local AS date), :side, "
-                            "CAST(:quantity AS numeric), CAST(:price AS numeric), CAST(:cost AS numeric), "
-                            "CAST(:commission AS numeric), CAST(:fees AS numeric), CAST(:realized_pnl AS numeric), "
-                            "CAST(:net_cash AS numeric), CAST(:net_cash_in_base AS numeric), "
-                            "CAST(:fx_rate_to_base AS numeric), :currency, :functional_currency"
-                            ") ON CONFLICT ON CONSTRAINT uq_event_trade_fill_account_exec DO UPDATE SET "
-                            "commission = EXCLUDED.commission, "
-                            "realized_pnl = EXCLUDED.realized_pnl, "
-                            "net_cash = EXCLUDED.net_cash, "
-                            "cost = EXCLUDED.cost"
-                        ),
-                        normalized_trade_requests,
-                    )
+                    connection.execute(self._SQL_TRADE_FILL_UPSERT, normalized_trade_requests)
 
                 if normalized_cashflow_requests:
-                    connection.execute(
-                        text(
-                            "INSERT INTO event_cashflow ("
-                            "account_id, instrument_id, ingestion_run_id, source_raw_record_id, transaction_id, cash_action, "
-                            "report_date_local, effective_at_utc, amount, amount_in_base, currency, functional_currency, "
-                            "withholding_tax, fees, is_correction"
-                            ") VALUES ("
-                            ":account_id, CAST(:instrument_id AS uuid), CAST(:ingestion_run_id AS uuid), "
-                            "CAST(:source_raw_record_id AS uuid), :transaction_id, :cash_action, "
-                            "CAST(:report_date_local AS date), CAST(:effective_at_utc AS timestamptz), "
-                            "CAST(:amount AS numeric), CAST(:amount_in_base AS numeric), :currency, :functional_currency, "
-                            "CAST(:withholding_tax AS numeric), CAST(:fees AS numeric), false"
-                            ") ON CONFLICT ON CONSTRAINT uq_event_cashflow_account_txn_action_ccy DO UPDATE SET "
-                            "ingestion_run_id = EXCLUDED.ingestion_run_id, "
-                            "source_raw_record_id = EXCLUDED.source_raw_record_id, "
-                            "instrument_id = COALESCE(EXCLUDED.instrument_id, event_cashflow.instrument_id), "
-                            "report_date_local = EXCLUDED.report_date_local, "
-                            "effective_at_utc = EXCLUDED.effective_at_utc, "
-                            "amount = EXCLUDED.amount, "
-                            "amount_in_base = EXCLUDED.amount_in_base, "
-                            "withholding_tax = EXCLUDED.withholding_tax, "
-                            "fees = EXCLUDED.fees, "
-                            "is_correction = event_cashflow.is_correction "
-                            "OR event_cashflow.amount IS DISTINCT FROM EXCLUDED.amount "
-                            "OR event_cashflow.report_date_local IS DISTINCT FROM EXCLUDED.report_date_local"
-                        ),
-                        normalized_cashflow_requests,
-                    )
+                    connection.execute(self._SQL_CASHFLOW_UPSERT, normalized_cashflow_requests)
 
                 if normalized_fx_requests:
-                    connection.execute(
-                        text(
-                            "INSERT INTO event_fx ("
-                            "account_id, ingestion_run_id, source_raw_record_id, transaction_id, report_date_local, currency, "
-                            "functional_currency, fx_rate, fx_source, provisional, diagnostic_code"
-                            ") VALUES ("
-                            ":account_id, CAST(:ingestion_run_id AS uuid), CAST(:source_raw_record_id AS uuid), :transaction_id, "
-                            "CAST(:report_date_local AS date), :currency, :functional_currency, "
-                            "CAST(:fx_rate AS numeric), :fx_source, :provisional, :diagnostic_code"
-                            ") ON CONFLICT ON CONSTRAINT uq_event_fx_account_txn_ccy_pair DO UPDATE SET "
-                            "report_date_local = EXCLUDED.report_date_local, "
-                            "fx_rate = EXCLUDED.fx_rate, "
-                            "fx_source = EXCLUDED.fx_source, "
-                            "provisional = EXCLUDED.provisional, "
-                            "diagnostic_code = EXCLUDED.diagnostic_code"
-                        ),
-                        normalized_fx_requests,
-                    )
+                    connection.execute(self._SQL_FX_UPSERT, normalized_fx_requests)
 
                 if corp_action_requests_without_action_id:
-                    connection.execute(
-                        text(
-                            "INSERT INTO event_corp_action ("
-                            "account_id, instrument_id, conid, ingestion_run_id, source_raw_record_id, action_id, "
-                            "transaction_id, reorg_code, report_date_local, description, requires_manual, provisional, manual_case_id"
-                            ") VALUES ("
-                            ":account_id, CAST(:instrument_id AS uuid), :conid, CAST(:ingestion_run_id AS uuid), "
-                            "CAST(:source_raw_record_id AS uuid), :action_id, :transaction_id, :reorg_code, "
-                            "CAST(:report_date_local AS date), :description, :requires_manual, :provisional, "
-                            "CAST(:manual_case_id AS uuid)"
-                            ") ON CONFLICT ON CONSTRAINT uq_event_corp_action_fallback DO UPDATE SET "
-                            "requires_manual = true, "
-                            "provisional = true, "
-                            "description = COALESCE(EXCLUDED.description, event_corp_action.description), "
-                            "manual_case_id = COALESCE(event_corp_action.manual_case_id, EXCLUDED.manual_case_id)"
-                        ),
-                        corp_action_requests_without_action_id,
-                    )
+                    connection.execute(self._SQL_CORP_ACTION_FALLBACK_UPSERT, corp_action_requests_without_action_id)
 
                 if corp_action_requests_with_action_id:
-                    connection.execute(
-                        text(
-                            "INSERT INTO event_corp_action ("
-                            "account_id, instrument_id, conid, ingestion_run_id, source_raw_record_id, action_id, "
-                            "transaction_id, reorg_code, report_date_local, description, requires_manual, provisional, manual_case_id"
-                            ") VALUES ("
-                            ":account_id, CAST(:instrument_id AS uuid), :conid, CAST(:ingestion_run_id AS uuid), "
-                            "CAST(:source_raw_record_id AS uuid), :action_id, :transaction_id, :reorg_code, "
-                            "CAST(:report_date_local AS date), :description, :requires_manual, :provisional, "
-                            "CAST(:manual_case_id AS uuid)"
-                            ") ON CONFLICT ON CONSTRAINT uq_event_corp_action_account_action DO UPDATE SET "
-                            "instrument_id = COALESCE(EXCLUDED.instrument_id, event_corp_action.instrument_id), "
-                            "transaction_id = COALESCE(EXCLUDED.transaction_id, event_corp_action.transaction_id), "
-                            "reorg_code = EXCLUDED.reorg_code, "
-                            "report_date_local = EXCLUDED.report_date_local, "
-                            "description = COALESCE(EXCLUDED.description, event_corp_action.description), "
-                            "requires_manual = EXCLUDED.requires_manual, "
-                            "provisional = EXCLUDED.provisional, "
-                            "manual_case_id = COALESCE(EXCLUDED.manual_case_id, event_corp_action.manual_case_id)"
-                        ),
-                        corp_action_requests_with_action_id,
-                    )
+                    connection.execute(self._SQL_CORP_ACTION_BY_ACTION_ID_UPSERT, corp_action_requests_with_action_id)
         except SQLAlchemyError as error:
             raise RuntimeError("canonical bulk upsert failed") from error
 
@@ -464,30 +502,31 @@ class SQLAlchemyCanonicalPersistenceService(CanonicalPersistenceRepositoryPort,
             RuntimeError: Raised when read operation fails.
         """
 
+        # Records are built while iterating the result, so each decoded row mapping is released
+        # as soon as its record exists instead of a full row list living beside the record list.
         try:
             with self._engine.connect() as connection:
                 rows = connection.execute(
                     text(query_template),
                     parameters,
-                ).mappings().all()
+                ).mappings()
+                return [
+                    RawRecordForCanonicalMapping(
+                        raw_record_id=row["raw_record_id"],
+                        ingestion_run_id=row["ingestion_run_id"],
+                        account_id=row["account_id"],
+                        period_key=row["period_key"],
+                        flex_query_id=row["flex_query_id"],
+                        report_date_local=row["report_date_local"],
+                        section_name=row["section_name"],
+                        source_row_ref=row["source_row_ref"],
+                        source_payload=dict(row["source_payload"]),
+                    )
+                    for row in rows
+                ]
         except SQLAlchemyError as error:
             raise RuntimeError("canonical raw row read failed") from error
 
-        return [
-            RawRecordForCanonicalMapping(
-                raw_record_id=row["raw_record_id"],
-                ingestion_run_id=row["ingestion_run_id"],
-                account_id=row["account_id"],
-                period_key=row["period_key"],
-                flex_query_id=row["flex_query_id"],
-                report_date_local=row["report_date_local"],
-                section_name=row["section_name"],
-                source_row_ref=row["source_row_ref"],
-                source_payload=dict(row["source_payload"]),
-            )
-            for row in rows
-        ]
-
     def _db_canonical_validate_trade_request(self, request: CanonicalTradeFillUpsertRequest) -> dict[str, Any]:
         """Validate canonical trade upsert request values.
 
@@ -672,14 +711,7 @@ class SQLAlchemyCanonicalPersistenceService(CanonicalPersistenceRepositoryPort,
             ValueError: Raised when value is invalid.
         """
 
-        if not isinstance(value, str):
-            raise ValueError(f"{field_name} must be a string")
-
-        normalized_value = value.strip()
-        if not normalized_value:
-            raise ValueError(f"{field_name} must not be blank")
-
-        return normalized_value
+        return db_validate_non_empty_text(value, field_name)
 
     def _db_canonical_validate_optional_text(self, value: str | None) -> str | None:
         """Validate optional text values.
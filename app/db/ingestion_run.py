@@ -34,6 +34,8 @@ class SQLAlchemyIngestionRunService(IngestionRunRepositoryPort):
         "duration_ms": "duration_ms",
     }
     _INGESTION_RUN_ALLOWED_SORT_DIRECTIONS = {"asc", "desc"}
+    # Compact, non-ASCII-escaping encoder for diagnostics timelines; jsonb re-normalizes whitespace anyway.
+    _DIAGNOSTICS_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
     _INGESTION_RUN_LIST_SELECT_COLUMNS = (
         "SELECT "
         "ingestion_run_id, account_id, run_type, status, period_key, flex_query_id, "
@@ -185,7 +187,7 @@ class SQLAlchemyIngestionRunService(IngestionRunRepositoryPort):
 
         diagnostics_payload = None
         if diagnostics is not None:
-            diagnostics_payload = json.dumps(diagnostics)
+            diagnostics_payload = self._DIAGNOSTICS_JSON_ENCODER.encode(diagnostics)
 
         try:
             with self._engine.begin() as connection:
@@ -199,7 +201,10 @@ class SQLAlchemyIngestionRunService(IngestionRunRepositoryPort):
                         "error_message = :error_message, "
                         "diagnostics = CAST(:diagnostics AS jsonb) "
                         "WHERE ingestion_run_id = :ingestion_run_id "
-                        "RETURNING ingestion_run_id"
+                        "RETURNING "
+                        "ingestion_run_id, account_id, run_type, status, period_key, flex_query_id, "
+                        "report_date_local, started_at_utc, ended_at_utc, duration_ms, "
+                        "error_code, error_message, created_at_utc"
                     ),
                     {
                         "status": status,
@@ -212,7 +217,11 @@ class SQLAlchemyIngestionRunService(IngestionRunRepositoryPort):
                 if updated_row is None:
                     raise LookupError("ingestion run not found")
 
-                return self._db_fetch_run_by_id_or_raise(connection=connection, ingestion_run_id=ingestion_run_id)
+                # RETURNING skips diagnostics: the caller's list is what was just written, so a copy
+                # of it avoids a second SELECT and a jsonb decode of the full timeline.
+                return self._map_ingestion_run_record(
+                    {**updated_row, "diagnostics": None if diagnostics is None else list(diagnostics)}
+                )
         except SQLAlchemyError as error:
             raise RuntimeError("failed to finalize ingestion run") from error
 
@@ -3,6 +3,7 @@
 All SQL and ORM access must remain in the db package and its submodules.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any, Protocol
@@ -10,6 +11,8 @@ from uuid import UUID
 
 from app.domain import HealthStatus
 
+from .validation import db_validate_non_empty_text
+
 
 class DatabaseHealthPort(Protocol):
     """Port definition for database connectivity verification."""
@@ -116,6 +119,20 @@ class RawArtifactReference:
     payload_sha256: str
     report_date_local: date | None
 
+    def __post_init__(self) -> None:
+        """Validate and normalize identity fields once at construction.
+
+        Raises:
+            ValueError: Raised when required identity values are missing.
+        """
+
+        for field_name in ("account_id", "period_key", "flex_query_id", "payload_sha256"):
+            object.__setattr__(
+                self,
+                field_name,
+                db_validate_non_empty_text(getattr(self, field_name), f"reference.{field_name}"),
+            )
+
 
 @dataclass(frozen=True)
 class RawArtifactPersistRequest:
@@ -131,6 +148,18 @@ class RawArtifactPersistRequest:
     reference: RawArtifactReference
     source_payload: bytes
 
+    def __post_init__(self) -> None:
+        """Validate artifact request fields once at construction.
+
+        Raises:
+            ValueError: Raised when the reference is missing or payload is not bytes.
+        """
+
+        if self.reference is None:
+            raise ValueError("request.reference must not be None")
+        if not isinstance(self.source_payload, bytes):
+            raise ValueError("request.source_payload must be bytes")
+
 
 @dataclass(frozen=True)
 class RawArtifactRecord:
@@ -164,7 +193,7 @@ class RawArtifactPersistResult:
     deduplicated: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RawRecordPersistRequest:
     """Input payload for one raw row persistence operation.
 
@@ -186,6 +215,62 @@ class RawRecordPersistRequest:
     source_row_ref: str
     source_payload: dict[str, Any]
 
+    def __post_init__(self) -> None:
+        """Validate and normalize row identity fields once at construction.
+
+        Raises:
+            ValueError: Raised when required row values are missing.
+        """
+
+        if self.artifact_reference is None:
+            raise ValueError("request.artifact_reference must not be None")
+        object.__setattr__(
+            self,
+            "section_name",
+            db_validate_non_empty_text(self.section_name, "request.section_name"),
+        )
+        object.__setattr__(
+            self,
+            "source_row_ref",
+            db_validate_non_empty_text(self.source_row_ref, "request.source_row_ref"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RawRecordDraft:
+    """Raw row values persisted together with their parent artifact.
+
+    Artifact identity, run identifier, and report date are taken from the
+    artifact request, so drafts only carry per-row values.
+
+    Attributes:
+        section_name: Flex section name.
+        source_row_ref: Deterministic source row reference within section.
+        source_payload: Source row payload as JSON-compatible object.
+    """
+
+    section_name: str
+    source_row_ref: str
+    source_payload: dict[str, Any]
+
+    def __post_init__(self) -> None:
+        """Validate and normalize row identity fields once at construction.
+
+        Raises:
+            ValueError: Raised when required row values are missing.
+        """
+
+        object.__setattr__(
+            self,
+            "section_name",
+            db_validate_non_empty_text(self.section_name, "request.section_name"),
+        )
+        object.__setattr__(
+            self,
+            "source_row_ref",
+            db_validate_non_empty_text(self.source_row_ref, "request.source_row_ref"),
+        )
+
 
 @dataclass(frozen=True)
 class RawRecordPersistResult:
@@ -201,6 +286,19 @@ class RawRecordPersistResult:
 
 
 @dataclass(frozen=True)
+class RawArtifactWithRecordsPersistResult:
+    """Result payload for single-transaction artifact and raw row persistence.
+
+    Attributes:
+        artifact_result: Persisted raw artifact row with dedupe indicator.
+        record_result: Inserted and deduplicated raw row counters.
+    """
+
+    artifact_result: RawArtifactPersistResult
+    record_result: RawRecordPersistResult
+
+
+@dataclass(frozen=True, slots=True)
 class RawRecordForCanonicalMapping:
     """Typed raw row payload required by canonical mapping workflows.
 
@@ -543,6 +641,25 @@ class RawPersistenceRepositoryPort(Protocol):
             RuntimeError: Raised when persistence fails.
         """
 
+    def db_raw_persist_artifact_and_records(
+        self,
+        artifact_request: RawArtifactPersistRequest,
+        record_drafts: Iterable[RawRecordDraft],
+    ) -> RawArtifactWithRecordsPersistResult:
+        """Persist one raw artifact and its raw rows in a single transaction.
+
+        Args:
+            artifact_request: Raw artifact persistence request payload.
+            record_drafts: Raw rows belonging to the artifact, consumed in one pass.
+
+        Returns:
+            RawArtifactWithRecordsPersistResult: Artifact upsert result and row counters.
+
+        Raises:
+            ValueError: Raised when request data is invalid.
+            RuntimeError: Raised when persistence fails.
+        """
+
 
 class RawRecordReadRepositoryPort(Protocol):
     """Port definition for raw-row reads used by canonical mapping workflows."""
@@ -600,6 +717,23 @@ class CanonicalPersistenceRepositoryPort(Protocol):
             RuntimeError: Raised when persistence operation fails.
         """
 
+    def db_canonical_instruments_bulk_upsert(
+        self,
+        requests: list[CanonicalInstrumentUpsertRequest],
+    ) -> list[CanonicalInstrumentRecord]:
+        """Persist or reuse canonical instruments by conid-first identity in one batch.
+
+        Args:
+            requests: Instrument upsert requests.
+
+        Returns:
+            list[CanonicalInstrumentRecord]: Persisted canonical instrument records, one per unique conid.
+
+        Raises:
+            ValueError: Raised when request values are invalid.
+            RuntimeError: Raised when persistence operation fails.
+        """
+
     def db_canonical_trade_fill_upsert(self, request: CanonicalTradeFillUpsertRequest) -> None:
         """UPSERT one canonical trade-fill event by frozen natural key.
 
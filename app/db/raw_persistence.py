@@ -4,9 +4,9 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from collections.abc import Iterable
 
-from sqlalchemy import Engine, text
+from sqlalchemy import Connection, Engine, text
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.db.interfaces import (
@@ -14,7 +14,9 @@ from app.db.interfaces import (
     RawArtifactPersistResult,
     RawArtifactRecord,
     RawArtifactReference,
+    RawArtifactWithRecordsPersistResult,
     RawPersistenceRepositoryPort,
+    RawRecordDraft,
     RawRecordPersistRequest,
     RawRecordPersistResult,
 )
@@ -23,6 +25,53 @@ from app.db.interfaces import (
 class SQLAlchemyRawPersistenceService(RawPersistenceRepositoryPort):
     """SQLAlchemy implementation of immutable raw persistence operations."""
 
+    _RAW_ARTIFACT_RETURNING_COLUMNS = (
+        "raw_artifact_id, ingestion_run_id, account_id, period_key, flex_query_id, "
+        "payload_sha256, report_date_local, created_at_utc"
+    )
+    _RAW_ARTIFACT_UPSERT_RETURNING_ROW = (
+        "INSERT INTO raw_artifact ("
+        "ingestion_run_id, account_id, period_key, flex_query_id, payload_sha256, report_date_local, source_payload"
+        ") VALUES ("
+        ":ingestion_run_id, :account_id, :period_key, :flex_query_id, :payload_sha256, :report_date_local, :source_payload"
+        ") "
+        "ON CONFLICT (account_id, period_key, flex_query_id, payload_sha256) DO UPDATE SET "
+        "created_at_utc = raw_artifact.created_at_utc "
+        "RETURNING " + _RAW_ARTIFACT_RETURNING_COLUMNS + ", (xmax = 0) AS inserted"
+    )
+    _RAW_RECORD_INSERT_FROM_RECORDSET = (
+        "INSERT INTO raw_record ("
+        "raw_artifact_id, ingestion_run_id, account_id, period_key, flex_query_id, payload_sha256, "
+        "report_date_local, section_name, source_row_ref, source_payload"
+        ") SELECT "
+        "r.raw_artifact_id, r.ingestion_run_id, r.account_id, r.period_key, r.flex_query_id, r.payload_sha256, "
+        "r.report_date_local, r.section_name, r.source_row_ref, r.source_payload "
+        "FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS r("
+        "raw_artifact_id uuid, ingestion_run_id uuid, account_id text, period_key text, flex_query_id text, "
+        "payload_sha256 text, report_date_local date, section_name text, source_row_ref text, source_payload jsonb"
+        ") ON CONFLICT ON CONSTRAINT uq_raw_record_artifact_section_source_ref DO NOTHING "
+        "RETURNING raw_record_id"
+    )
+    _RAW_RECORD_INSERT_FOR_ARTIFACT_FROM_RECORDSET = (
+        "INSERT INTO raw_record ("
+        "raw_artifact_id, ingestion_run_id, account_id, period_key, flex_query_id, payload_sha256, "
+        "report_date_local, section_name, source_row_ref, source_payload"
+        ") SELECT "
+        "CAST(:raw_artifact_id AS uuid), CAST(:ingestion_run_id AS uuid), :account_id, :period_key, :flex_query_id, "
+        ":payload_sha256, CAST(:report_date_local AS date), r.section_name, r.source_row_ref, r.source_payload "
+        "FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS r("
+        "section_name text, source_row_ref text, source_payload jsonb"
+        ") ON CONFLICT ON CONSTRAINT uq_raw_record_artifact_section_source_ref DO NOTHING "
+        "RETURNING raw_record_id"
+    )
+    # Built once per process so each call reuses the same TextClause and its
+    # statement cache key instead of re-parsing bind params on every call.
+    _SQL_RAW_ARTIFACT_UPSERT = text(_RAW_ARTIFACT_UPSERT_RETURNING_ROW)
+    _SQL_RAW_RECORD_INSERT = text(_RAW_RECORD_INSERT_FROM_RECORDSET)
+    _SQL_RAW_RECORD_INSERT_FOR_ARTIFACT = text(_RAW_RECORD_INSERT_FOR_ARTIFACT_FROM_RECORDSET)
+    # Compact, non-ASCII-escaping encoder; recordset rows are freshly built dicts with no cycles.
+    _RECORDSET_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, check_circular=False, separators=(",", ":"))
+
     def __init__(self, engine: Engine):
         """Initialize raw persistence service.
 
@@ -51,48 +100,12 @@ class SQLAlchemyRawPersistenceService(RawPersistenceRepositoryPort):
             RawArtifactPersistResult: Persisted artifact row with dedupe indicator.
 
         Raises:
-            ValueError: Raised when request values are invalid.
             RuntimeError: Raised when persistence operation fails.
         """
 
-        normalized_reference = self._db_raw_validate_reference(request.reference)
-        if not isinstance(request.source_payload, bytes):
-            raise ValueError("request.source_payload must be bytes")
-
         try:
             with self._engine.begin() as connection:
-                persisted_row = connection.execute(
-                    text(
-                        "INSERT INTO raw_artifact ("
-                        "ingestion_run_id, account_id, period_key, flex_query_id, payload_sha256, report_date_local, source_payload"
-                        ") VALUES ("
-                        ":ingestion_run_id, :account_id, :period_key, :flex_query_id, :payload_sha256, :report_date_local, :source_payload"
-                        ") "
-                        "ON CONFLICT (account_id, period_key, flex_query_id, payload_sha256) DO UPDATE SET "
-                        "created_at_utc = raw_artifact.created_at_utc "
-                        "RETURNING raw_artifact_id, ingestion_run_id, account_id, period_key, flex_query_id, "
-                        "payload_sha256, report_date_local, source_payload, created_at_utc, (xmax = 0) AS inserted"
-                    ),
-                    {
-                        "ingestion_run_id": request.ingestion_run_id,
-                        "account_id": normalized_reference.account_id,
-                        "period_key": normalized_reference.period_key,
-                        "flex_query_id": normalized_reference.flex_query_id,
-                        "payload_sha256": normalized_reference.payload_sha256,
-                        "report_date_local": normalized_reference.report_date_local,
-                        "source_payload": request.source_payload,
-                    },
-                ).mappings().fetchone()
-
-                if persisted_row is None:
-                    raise RuntimeError("raw artifact upsert failed to return persisted row")
-
-                deduplicated = not bool(persisted_row["inserted"])
-
-                return RawArtifactPersistResult(
-                    artifact=self._db_raw_map_artifact_row(persisted_row),
-                    deduplicated=deduplicated,
-                )
+                return self._db_raw_execute_artifact_upsert(connection, request)
         except SQLAlchemyError as error:
             raise RuntimeError("raw artifact persistence failed") from error
 
@@ -115,149 +128,191 @@ class SQLAlchemyRawPersistenceService(RawPersistenceRepositoryPort):
         if len(requests) == 0:
             return RawRecordPersistResult(inserted_count=0, deduplicated_count=0)
 
-        normalized_requests = [self._db_raw_validate_row_request(request) for request in requests]
-        parameter_rows = [
+        if any(request is None for request in requests):
+            raise ValueError("request must not be None")
+
+        recordset_rows = [
             {
-                "raw_artifact_id": normalized_request.raw_artifact_id,
-                "ingestion_run_id": normalized_request.ingestion_run_id,
-                "account_id": normalized_request.artifact_reference.account_id,
-                "period_key": normalized_request.artifact_reference.period_key,
-                "flex_query_id": normalized_request.artifact_reference.flex_query_id,
-                "payload_sha256": normalized_request.artifact_reference.payload_sha256,
-                "report_date_local": normalized_request.report_date_local,
-                "section_name": normalized_request.section_name,
-                "source_row_ref": normalized_request.source_row_ref,
-                "source_payload": json.dumps(normalized_request.source_payload),
+                "raw_artifact_id": str(request.raw_artifact_id),
+                "ingestion_run_id": str(request.ingestion_run_id),
+                "account_id": request.artifact_reference.account_id,
+                "period_key": request.artifact_reference.period_key,
+                "flex_query_id": request.artifact_reference.flex_query_id,
+                "payload_sha256": request.artifact_reference.payload_sha256,
+                "report_date_local": (
+                    request.report_date_local.isoformat()
+                    if request.report_date_local is not None
+                    else None
+                ),
+                "section_name": request.section_name,
+                "source_row_ref": request.source_row_ref,
+                "source_payload": request.source_payload,
             }
-            for normalized_request in normalized_requests
+            for request in requests
         ]
+        # Serialize before opening the transaction to keep CPU work off the held connection.
+        recordset_json = self._RECORDSET_JSON_ENCODER.encode(recordset_rows)
 
         try:
             with self._engine.begin() as connection:
-                insert_result = connection.execute(
-                    text(
-                        "INSERT INTO raw_record ("
-                        "raw_artifact_id, ingestion_run_id, account_id, period_key, flex_query_id, payload_sha256, "
-                        "report_date_local, section_name, source_row_ref, source_payload"
-                        ") VALUES ("
-                        ":raw_artifact_id, :ingestion_run_id, :account_id, :period_key, :flex_query_id, :payload_sha256, "
-                        ":report_date_local, :section_name, :source_row_ref, CAST(:source_payload AS jsonb)"
-                        ") ON CONFLICT ON CONSTRAINT uq_raw_record_artifact_section_source_ref DO NOTHING"
-                    ),
-                    parameter_rows,
-                )
-
-                inserted_count = max(insert_result.rowcount, 0)
-                deduplicated_count = len(parameter_rows) - inserted_count
-                return RawRecordPersistResult(inserted_count=inserted_count, deduplicated_count=deduplicated_count)
+                return self._db_raw_execute_record_insert(connection, recordset_json, len(recordset_rows))
         except SQLAlchemyError as error:
             raise RuntimeError("raw row persistence failed") from error
 
-    def _db_raw_validate_reference(self, reference: RawArtifactReference) -> RawArtifactReference:
-        """Validate and normalize raw artifact identity fields.
+    def db_raw_persist_artifact_and_records(
+        self,
+        artifact_request: RawArtifactPersistRequest,
+        record_drafts: Iterable[RawRecordDraft],
+    ) -> RawArtifactWithRecordsPersistResult:
+        """Persist one raw artifact and its raw rows in a single transaction.
 
         Args:
-            reference: Raw artifact identity values.
+            artifact_request: Raw artifact persistence request payload.
+            record_drafts: Raw rows belonging to the artifact, consumed in one pass.
 
         Returns:
-            RawArtifactReference: Normalized reference values.
+            RawArtifactWithRecordsPersistResult: Artifact upsert result and row counters.
 
         Raises:
-            ValueError: Raised when required values are missing.
+            ValueError: Raised when request values are invalid.
+            RuntimeError: Raised when persistence operation fails.
         """
 
-        if reference is None:
-            raise ValueError("request.reference must not be None")
-
-        account_id = self._db_raw_validate_non_empty_text(reference.account_id, "reference.account_id")
-        period_key = self._db_raw_validate_non_empty_text(reference.period_key, "reference.period_key")
-        flex_query_id = self._db_raw_validate_non_empty_text(reference.flex_query_id, "reference.flex_query_id")
-        payload_sha256 = self._db_raw_validate_non_empty_text(reference.payload_sha256, "reference.payload_sha256")
-
-        return RawArtifactReference(
-            account_id=account_id,
-            period_key=period_key,
-            flex_query_id=flex_query_id,
-            payload_sha256=payload_sha256,
-            report_date_local=reference.report_date_local,
-        )
-
-    def _db_raw_validate_row_request(self, request: RawRecordPersistRequest) -> RawRecordPersistRequest:
-        """Validate and normalize one raw row persistence request.
-
-        Args:
-            request: Raw row request.
-
-        Returns:
-            RawRecordPersistRequest: Normalized request values.
-
-        Raises:
-            ValueError: Raised when required fields are invalid.
-        """
+        if record_drafts is None:
+            raise ValueError("record_drafts must not be None")
+
+        report_date_local = artifact_request.reference.report_date_local
+        report_date_local_text = report_date_local.isoformat() if report_date_local is not None else None
+        # Artifact-level columns are bound once as scalars; only per-row fields go through the recordset.
+        recordset_rows: list[dict[str, object]] = []
+        for record_draft in record_drafts:
+            if record_draft is None:
+                raise ValueError("record_draft must not be None")
+            recordset_rows.append(
+                {
+                    "section_name": record_draft.section_name,
+                    "source_row_ref": record_draft.source_row_ref,
+                    "source_payload": record_draft.source_payload,
+                }
+            )
+        row_count = len(recordset_rows)
+        recordset_json = self._RECORDSET_JSON_ENCODER.encode(recordset_rows)
+        del recordset_rows
 
-        if request is None:
-            raise ValueError("request must not be None")
+        try:
+            with self._engine.begin() as connection:
+                artifact_result = self._db_raw_execute_artifact_upsert(connection, artifact_request)
+                if row_count == 0:
+                    record_result = RawRecordPersistResult(inserted_count=0, deduplicated_count=0)
+                else:
+                    artifact_reference = artifact_result.artifact.reference
+                    inserted_rows = connection.execute(
+                        self._SQL_RAW_RECORD_INSERT_FOR_ARTIFACT,
+                        {
+                            "raw_artifact_id": str(artifact_result.artifact.raw_artifact_id),
+                            "ingestion_run_id": str(artifact_request.ingestion_run_id),
+                            "account_id": artifact_reference.account_id,
+                            "period_key": artifact_reference.period_key,
+                            "flex_query_id": artifact_reference.flex_query_id,
+                            "payload_sha256": artifact_reference.payload_sha256,
+                            "report_date_local": report_date_local_text,
+                            "rows": recordset_json,
+                        },
+                    ).all()
+                    inserted_count = len(inserted_rows)
+                    record_result = RawRecordPersistResult(
+                        inserted_count=inserted_count,
+                        deduplicated_count=row_count - inserted_count,
+                    )
+        except SQLAlchemyError as error:
+            raise RuntimeError("raw artifact and row persistence failed") from error
 
-        return RawRecordPersistRequest(
-            ingestion_run_id=request.ingestion_run_id,
-            raw_artifact_id=request.raw_artifact_id,
-            artifact_reference=self._db_raw_validate_reference(request.artifact_reference),
-            report_date_local=request.report_date_local,
-            section_name=self._db_raw_validate_non_empty_text(request.section_name, "request.section_name"),
-            source_row_ref=self._db_raw_validate_non_empty_text(request.source_row_ref, "request.source_row_ref"),
-            source_payload=request.source_payload,
-        )
+        return RawArtifactWithRecordsPersistResult(artifact_result=artifact_result, record_result=record_result)
 
-    def _db_raw_map_artifact_row(self, row: Any) -> RawArtifactRecord:
-        """Map SQL row payload into typed raw artifact record.
+    def _db_raw_execute_artifact_upsert(
+        self,
+        connection: Connection,
+        request: RawArtifactPersistRequest,
+    ) -> RawArtifactPersistResult:
+        """Execute raw artifact upsert on an open transaction connection.
 
         Args:
-            row: SQLAlchemy row mapping.
+            connection: Connection bound to the caller's transaction.
+            request: Validated raw artifact persistence request payload.
 
         Returns:
-            RawArtifactRecord: Typed raw artifact persistence record.
+            RawArtifactPersistResult: Persisted artifact row with dedupe indicator.
 
         Raises:
-            TypeError: Raised when `source_payload` is not bytes.
+            RuntimeError: Raised when the upsert returns no row.
         """
 
-        source_payload = row["source_payload"]
-        if not isinstance(source_payload, bytes):
-            raise TypeError("raw_artifact.source_payload must be bytes")
-
-        return RawArtifactRecord(
-            raw_artifact_id=row["raw_artifact_id"],
-            ingestion_run_id=row["ingestion_run_id"],
-            reference=RawArtifactReference(
-                account_id=row["account_id"],
-                period_key=row["period_key"],
-                flex_query_id=row["flex_query_id"],
-                payload_sha256=row["payload_sha256"],
-                report_date_local=row["report_date_local"],
+        reference = request.reference
+        persisted_row = connection.execute(
+            self._SQL_RAW_ARTIFACT_UPSERT,
+            {
+                "ingestion_run_id": request.ingestion_run_id,
+                "account_id": reference.account_id,
+                "period_key": reference.period_key,
+                "flex_query_id": reference.flex_query_id,
+                "payload_sha256": reference.payload_sha256,
+                "report_date_local": reference.report_date_local,
+                "source_payload": request.source_payload,
+            },
+        ).fetchone()
+
+        if persisted_row is None:
+            raise RuntimeError("raw artifact upsert failed to return persisted row")
+
+        (
+            raw_artifact_id,
+            ingestion_run_id,
+            account_id,
+            period_key,
+            flex_query_id,
+            payload_sha256,
+            report_date_local,
+            created_at_utc,
+            inserted,
+        ) = persisted_row
+        return RawArtifactPersistResult(
+            artifact=RawArtifactRecord(
+                raw_artifact_id=raw_artifact_id,
+                ingestion_run_id=ingestion_run_id,
+                reference=RawArtifactReference(
+                    account_id=account_id,
+                    period_key=period_key,
+                    flex_query_id=flex_query_id,
+                    payload_sha256=payload_sha256,
+                    report_date_local=report_date_local,
+                ),
+                # Dedupe key includes the payload SHA-256: stored bytes equal request bytes.
+                source_payload=request.source_payload,
+                created_at_utc=created_at_utc,
             ),
-            source_payload=source_payload,
-            created_at_utc=row["created_at_utc"],
+            deduplicated=not bool(inserted),
         )
 
-    def _db_raw_validate_non_empty_text(self, value: str, field_name: str) -> str:
-        """Validate text value and normalize surrounding whitespace.
+    def _db_raw_execute_record_insert(
+        self,
+        connection: Connection,
+        recordset_json: str,
+        row_count: int,
+    ) -> RawRecordPersistResult:
+        """Execute raw row recordset insert on an open transaction connection.
 
         Args:
-            value: Input text value.
-            field_name: Field label for deterministic error messages.
+            connection: Connection bound to the caller's transaction.
+            recordset_json: JSON array of raw row recordset objects.
+            row_count: Number of rows encoded in `recordset_json`.
 
         Returns:
-            str: Normalized non-empty text value.
+            RawRecordPersistResult: Inserted and deduplicated row counters.
 
         Raises:
-            ValueError: Raised when value is not valid non-empty text.
+            RuntimeError: This method does not raise runtime errors directly.
         """
 
-        if not isinstance(value, str):
-            raise ValueError(f"{field_name} must be a string")
-
-        normalized_value = value.strip()
-        if not normalized_value:
-            raise ValueError(f"{field_name} must not be blank")
-
-        return normalized_value
+        inserted_rows = connection.execute(self._SQL_RAW_RECORD_INSERT, {"rows": recordset_json}).all()
+        inserted_count = len(inserted_rows)
+        return RawRecordPersistResult(inserted_count=inserted_count, deduplicated_count=row_count - inserted_count)
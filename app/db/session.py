@@ -7,24 +7,67 @@ boundary for all SQLAlchemy usage.
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import sessionmaker
 
+from app.config import AppSettings
 
-def db_create_engine(database_url: str) -> Engine:
+
+def db_create_engine(
+    database_url: str,
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_recycle_seconds: int = 1800,
+) -> Engine:
     """Create the SQLAlchemy engine for application database access.
 
     Args:
         database_url: SQLAlchemy database URL.
+        pool_size: Persistent connections kept in the pool.
+        max_overflow: Extra connections allowed beyond `pool_size` under burst load.
+        pool_recycle_seconds: Connection age after which pooled connections are recycled.
 
     Returns:
         Engine: Configured SQLAlchemy engine.
 
     Raises:
-        ValueError: Raised when the database URL is blank.
+        ValueError: Raised when the database URL is blank or pool values are invalid.
     """
 
     if not database_url.strip():
         raise ValueError("database_url must not be blank")
+    if pool_size < 1:
+        raise ValueError("pool_size must be >= 1")
+    if max_overflow < 0:
+        raise ValueError("max_overflow must be >= 0")
+    if pool_recycle_seconds < 1:
+        raise ValueError("pool_recycle_seconds must be >= 1")
+
+    return create_engine(
+        database_url,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle_seconds,
+    )
+
+
+def db_create_engine_from_settings(settings: AppSettings) -> Engine:
+    """Create the SQLAlchemy engine from validated application settings.
+
+    Args:
+        settings: Validated application settings carrying database URL and pool values.
+
+    Returns:
+        Engine: Configured SQLAlchemy engine.
+
+    Raises:
+        ValueError: Raised when the database URL is blank or pool values are invalid.
+    """
 
-    return create_engine(database_url, pool_pre_ping=True)
+    return db_create_engine(
+        database_url=settings.database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle_seconds=settings.db_pool_recycle_seconds,
+    )
 
 
 def db_create_session_factory(engine: Engine) -> sessionmaker:
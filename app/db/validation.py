@@ -0,0 +1,27 @@
+"""Shared input validation helpers for db-layer contracts and services."""
+
+from __future__ import annotations
+
+
+def db_validate_non_empty_text(value: str, field_name: str) -> str:
+    """Validate text value and normalize surrounding whitespace.
+
+    Args:
+        value: Input text value.
+        field_name: Field label for deterministic error messages.
+
+    Returns:
+        str: Normalized non-empty text value.
+
+    Raises:
+        ValueError: Raised when value is not valid non-empty text.
+    """
+
+    if not isinstance(value, str):
+        raise ValueError(f"{field_name} must be a string")
+
+    normalized_value = value.strip()
+    if not normalized_value:
+        raise ValueError(f"{field_name} must not be blank")
+
+    return normalized_value
@@ -7,13 +7,22 @@ canonical mapping.
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from datetime import date, datetime, timezone
+from functools import lru_cache
+import re
 
 _DOMAIN_FLEX_TIMESTAMP_TZ_ABBREVIATION_TO_OFFSET = {
     "EST": "-0500",
     "EDT": "-0400",
 }
 
+_DOMAIN_FLEX_TIMESTAMP_TZ_ABBREVIATION_PATTERN = re.compile(
+    r"^(?P<local_timestamp>.*\S)\s+(?P<abbreviation>"
+    + "|".join(_DOMAIN_FLEX_TIMESTAMP_TZ_ABBREVIATION_TO_OFFSET)
+    + r")$"
+)
+
 _DOMAIN_FLEX_SUPPORTED_DATE_FORMATS = (
     "%Y/%m/%d",
     "%Y-%m-%d",
@@ -25,6 +34,21 @@ _DOMAIN_FLEX_SUPPORTED_DATE_FORMATS = (
 
 _DOMAIN_FLEX_NULL_SENTINELS = frozenset({"-", "--", "N/A"})
 
+_DOMAIN_FLEX_SUPPORTED_TIMESTAMP_FORMATS = (
+    "%Y%m%d;%H%M%S",
+    "%Y-%m-%d,%H:%M:%S",
+)
+
+_DOMAIN_FLEX_TIMESTAMP_WITH_TZ_OFFSET_FORMAT = "%d %B, %Y %I:%M %p %z"
+
+_DOMAIN_FLEX_DATE_CANDIDATE_SEPARATORS = (";", "T", " ")
+
+# Dominant IBKR shapes, matched with ASCII digit classes so captured components are always digit-only.
+_DOMAIN_FLEX_COMPACT_DATE_PATTERN = re.compile(r"([0-9]{4})([0-9]{2})([0-9]{2})")
+_DOMAIN_FLEX_SEPARATED_DATE_PATTERN = re.compile(r"([0-9]{4})([-/])([0-9]{2})\2([0-9]{2})(?:[;T ].*)?", re.DOTALL)
+_DOMAIN_FLEX_COMPACT_TIMESTAMP_PATTERN = re.compile(r"([0-9]{4})([0-9]{2})([0-9]{2});([0-9]{2})([0-9]{2})([0-9]{2})")
+_DOMAIN_FLEX_SEPARATED_TIMESTAMP_PATTERN = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2}),([0-9]{2}):([0-9]{2}):([0-9]{2})")
+
 
 def domain_flex_normalize_optional_text(value: object | None) -> str | None:
     """Normalize one optional Flex text value using shared null-sentinel policy.
@@ -52,6 +76,9 @@ def domain_flex_normalize_optional_text(value: object | None) -> str | None:
     return normalized_value
 
 
+# Flex rows repeat a handful of report/trade date texts, and `date` results are immutable, so
+# a bounded memo turns repeat parses into one dict hit across mapping and extraction calls.
+@lru_cache(maxsize=4096)
 def domain_flex_parse_local_date(value: str) -> date | None:
     """Parse one Flex local date value into `date`.
 
@@ -69,6 +96,10 @@ def domain_flex_parse_local_date(value: str) -> date | None:
     if not normalized_value:
         return None
 
+    fast_parsed_value = _domain_flex_try_parse_date_by_shape(normalized_value)
+    if fast_parsed_value is not None:
+        return fast_parsed_value
+
     for candidate in _domain_flex_build_date_candidates(normalized_value):
         try:
             return date.fromisoformat(candidate)
@@ -106,6 +137,10 @@ def domain_flex_parse_timestamp_to_utc_iso(value: str) -> str | None:
     if not normalized_value:
         return None
 
+    fast_parsed_value = _domain_flex_try_parse_timestamp_by_shape(normalized_value)
+    if fast_parsed_value is not None:
+        return _domain_flex_normalize_timestamp_to_utc_iso(fast_parsed_value)
+
     for candidate in _domain_flex_build_timestamp_candidates(normalized_value):
         try:
             parsed_value = datetime.fromisoformat(candidate)
@@ -113,7 +148,7 @@ def domain_flex_parse_timestamp_to_utc_iso(value: str) -> str | None:
             continue
         return _domain_flex_normalize_timestamp_to_utc_iso(parsed_value)
 
-    for supported_format in ("%Y%m%d;%H%M%S", "%Y-%m-%d,%H:%M:%S"):
+    for supported_format in _DOMAIN_FLEX_SUPPORTED_TIMESTAMP_FORMATS:
         try:
             parsed_value = datetime.strptime(normalized_value, supported_format)
         except ValueError:
@@ -123,7 +158,7 @@ def domain_flex_parse_timestamp_to_utc_iso(value: str) -> str | None:
     timestamp_with_numeric_offset = _domain_flex_replace_ibkr_timezone_abbreviation_with_offset(normalized_value)
     if timestamp_with_numeric_offset is not None:
         try:
-            parsed_value = datetime.strptime(timestamp_with_numeric_offset, "%d %B, %Y %I:%M %p %z")
+            parsed_value = datetime.strptime(timestamp_with_numeric_offset, _DOMAIN_FLEX_TIMESTAMP_WITH_TZ_OFFSET_FORMAT)
         except ValueError:
             return None
         return _domain_flex_normalize_timestamp_to_utc_iso(parsed_value)
@@ -131,6 +166,115 @@ def domain_flex_parse_timestamp_to_utc_iso(value: str) -> str | None:
     return None
 
 
+def _domain_flex_try_parse_date_by_shape(normalized_value: str) -> date | None:
+    """Parse dominant Flex date shapes directly without exception-driven fallback.
+
+    Handles `YYYYMMDD`, `YYYY-MM-DD`, and `YYYY/MM/DD` with optional trailing
+    timestamp text. Unknown shapes return None so callers use the full
+    candidate/format chain.
+
+    Args:
+        normalized_value: Stripped source date value.
+
+    Returns:
+        date | None: Parsed date for known shapes, else None.
+
+    Raises:
+        RuntimeError: This helper does not raise runtime errors.
+    """
+
+    if not normalized_value.isascii():
+        return None
+
+    compact_match = _DOMAIN_FLEX_COMPACT_DATE_PATTERN.fullmatch(normalized_value)
+    if compact_match is not None:
+        return _domain_flex_build_date(*compact_match.groups())
+
+    separated_match = _DOMAIN_FLEX_SEPARATED_DATE_PATTERN.fullmatch(normalized_value)
+    if separated_match is not None:
+        return _domain_flex_build_date(separated_match[1], separated_match[3], separated_match[4])
+
+    return None
+
+
+def _domain_flex_try_parse_timestamp_by_shape(normalized_value: str) -> datetime | None:
+    """Parse dominant IBKR timestamp shapes directly without exception-driven fallback.
+
+    Handles `YYYYMMDD;HHMMSS` and `YYYY-MM-DD,HH:MM:SS`. Unknown shapes return
+    None so callers use the full candidate/format chain.
+
+    Args:
+        normalized_value: Stripped source timestamp value.
+
+    Returns:
+        datetime | None: Parsed naive timestamp for known shapes, else None.
+
+    Raises:
+        RuntimeError: This helper does not raise runtime errors.
+    """
+
+    timestamp_match = _DOMAIN_FLEX_COMPACT_TIMESTAMP_PATTERN.fullmatch(normalized_value)
+    if timestamp_match is None:
+        timestamp_match = _DOMAIN_FLEX_SEPARATED_TIMESTAMP_PATTERN.fullmatch(normalized_value)
+    if timestamp_match is None:
+        return None
+    return _domain_flex_build_datetime(*timestamp_match.groups())
+
+
+def _domain_flex_build_date(year_text: str, month_text: str, day_text: str) -> date | None:
+    """Build calendar date from digit-only component slices.
+
+    Args:
+        year_text: Four-digit year text.
+        month_text: Two-digit month text.
+        day_text: Two-digit day text.
+
+    Returns:
+        date | None: Calendar date, or None when components are not a valid date.
+
+    Raises:
+        RuntimeError: This helper does not raise runtime errors.
+    """
+
+    try:
+        return date(int(year_text), int(month_text), int(day_text))
+    except ValueError:
+        return None
+
+
+def _domain_flex_build_datetime(
+    year_text: str,
+    month_text: str,
+    day_text: str,
+    hour_text: str,
+    minute_text: str,
+    second_text: str,
+) -> datetime | None:
+    """Build naive datetime from digit-only component slices.
+
+    Args:
+        year_text: Four-digit year text.
+        month_text: Two-digit month text.
+        day_text: Two-digit day text.
+        hour_text: Two-digit hour text.
+        minute_text: Two-digit minute text.
+        second_text: Two-digit second text.
+
+    Returns:
+        datetime | None: Naive datetime, or None when components are not valid.
+
+    Raises:
+        RuntimeError: This helper does not raise runtime errors.
+    """
+
+    try:
+        return datetime(
+            int(year_text), int(month_text), int(day_text), int(hour_text), int(minute_text), int(second_text)
+        )
+    except ValueError:
+        return None
+
+
 def _domain_flex_replace_ibkr_timezone_abbreviation_with_offset(normalized_value: str) -> str | None:
     """Replace known IBKR timezone abbreviations with numeric UTC offset.
 
@@ -144,76 +288,94 @@ def _domain_flex_replace_ibkr_timezone_abbreviation_with_offset(normalized_value
         RuntimeError: This helper does not raise runtime errors.
     """
 
-    if len(normalized_value) < 3:
+    abbreviation_match = _DOMAIN_FLEX_TIMESTAMP_TZ_ABBREVIATION_PATTERN.match(normalized_value)
+    if abbreviation_match is None:
         return None
 
-    timezone_abbreviation = normalized_value[-3:]
-    timezone_offset = _DOMAIN_FLEX_TIMESTAMP_TZ_ABBREVIATION_TO_OFFSET.get(timezone_abbreviation)
-    if timezone_offset is None:
-        return None
-    return f"{normalized_value[:-3]}{timezone_offset}"
+    timezone_offset = _DOMAIN_FLEX_TIMESTAMP_TZ_ABBREVIATION_TO_OFFSET[abbreviation_match.group("abbreviation")]
+    return f"{abbreviation_match.group('local_timestamp')} {timezone_offset}"
 
 
-def _domain_flex_build_date_candidates(normalized_value: str) -> list[str]:
+def _domain_flex_build_date_candidates(normalized_value: str) -> Iterable[str]:
     """Build deterministic date parse candidates for Flex values.
 
     Args:
         normalized_value: Stripped source date value.
 
     Returns:
-        list[str]: Ordered de-duplicated candidate values.
+        Iterable[str]: Ordered de-duplicated candidate values.
 
     Raises:
         RuntimeError: This helper does not raise runtime errors.
     """
 
-    return _domain_flex_build_split_candidates(normalized_value=normalized_value, separators=(";", "T", " "))
+    if not any(separator in normalized_value for separator in _DOMAIN_FLEX_DATE_CANDIDATE_SEPARATORS):
+        return (normalized_value,)
+
+    return _domain_flex_build_split_candidates(
+        normalized_value=normalized_value,
+        separators=_DOMAIN_FLEX_DATE_CANDIDATE_SEPARATORS,
+    )
 
 
-def _domain_flex_build_timestamp_candidates(normalized_value: str) -> list[str]:
+def _domain_flex_build_timestamp_candidates(normalized_value: str) -> Iterable[str]:
     """Build deterministic timestamp parse candidates for Flex values.
 
     Args:
         normalized_value: Stripped source timestamp value.
 
     Returns:
-        list[str]: Ordered de-duplicated candidate values.
+        Iterable[str]: Ordered de-duplicated candidate values.
 
     Raises:
         RuntimeError: This helper does not raise runtime errors.
     """
 
+    has_utc_suffix = normalized_value.endswith("Z")
+    has_semicolon = ";" in normalized_value
+    has_comma = "," in normalized_value
+    if not (has_utc_suffix or has_semicolon or has_comma):
+        return (normalized_value,)
+
     candidate_values: list[str] = [normalized_value]
-    if normalized_value.endswith("Z"):
+    if has_utc_suffix:
         candidate_values.append(f"{normalized_value[:-1]}+00:00")
-    if ";" in normalized_value:
+    if has_semicolon:
         date_part, time_part = normalized_value.split(";", maxsplit=1)
         candidate_values.append(f"{date_part}T{time_part}")
-    if "," in normalized_value:
+    if has_comma:
         date_part, time_part = normalized_value.split(",", maxsplit=1)
         candidate_values.append(f"{date_part}T{time_part.strip()}")
     return _domain_flex_deduplicate_candidates(candidate_values)
 
 
-def _domain_flex_build_split_candidates(normalized_value: str, separators: tuple[str, ...]) -> list[str]:
-    """Build deterministic split candidates using configured separators.
+def _domain_flex_build_split_candidates(normalized_value: str, separators: tuple[str, ...]) -> Iterator[str]:
+    """Yield deterministic split candidates using configured separators.
+
+    Candidates are produced lazily so callers stop splitting once one
+    candidate parses.
 
     Args:
         normalized_value: Stripped source value.
         separators: Separators that may indicate trailing timestamp text.
 
     Returns:
-        list[str]: Ordered de-duplicated candidates.
+        Iterator[str]: Ordered de-duplicated candidates.
 
     Raises:
         RuntimeError: This helper does not raise runtime errors.
     """
 
-    candidate_values: list[str] = [normalized_value]
+    yield normalized_value
+    yielded_values = {normalized_value}
     for separator in separators:
-        if separator in normalized_value:
-            candidate_values.append(normalized_value.split(separator, maxsplit=1)[0])
-    return _domain_flex_deduplicate_candidates(candidate_values)
+        if separator not in normalized_value:
+            continue
+        candidate = normalized_value.split(separator, maxsplit=1)[0]
+        if candidate in yielded_values:
+            continue
+        yielded_values.add(candidate)
+        yield candidate
 
 
 def _domain_flex_deduplicate_candidates(candidate_values: list[str]) -> list[str]:
@@ -229,14 +391,7 @@ def _domain_flex_deduplicate_candidates(candidate_values: list[str]) -> list[str
         RuntimeError: This helper does not raise runtime errors.
     """
 
-    seen_values: set[str] = set()
-    unique_candidates: list[str] = []
-    for candidate in candidate_values:
-        if candidate in seen_values:
-            continue
-        seen_values.add(candidate)
-        unique_candidates.append(candidate)
-    return unique_candidates
+    return list(dict.fromkeys(candidate_values))
 
 
 def _domain_flex_normalize_timestamp_to_utc_iso(value: datetime) -> str:
@@ -5,11 +5,19 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
+_UTC = timezone.utc
 
+
+# FSN[2026-10-17]: ALWAYS return plain JSON-ready dicts from the stage event builder.
+# Context: timelines are persisted verbatim as ingestion_run.diagnostics JSON and read back with
+# dict access by diagnostics extraction and the API; a slots dataclass would need a conversion pass.
+# Guard: builder emits only str keys with str/dict values, so json.dumps needs no default hook.
+# Test: test_domain_build_stage_event_round_trips_through_json
 def domain_build_stage_event(
     stage: str,
     status: str,
     details: dict[str, Any] | None = None,
+    at_utc: datetime | None = None,
 ) -> dict[str, object]:
     """Build one structured timeline event payload.
 
@@ -17,6 +25,7 @@ def domain_build_stage_event(
         stage: Stage name.
         status: Stage status marker.
         details: Optional structured details object.
+        at_utc: Optional event timestamp so callers can share one clock read across a burst of events.
 
     Returns:
         dict[str, object]: Structured timeline event.
@@ -28,7 +37,7 @@ def domain_build_stage_event(
     event_payload: dict[str, object] = {
         "stage": stage,
         "status": status,
-        "at_utc": datetime.now(timezone.utc).isoformat(),
+        "at_utc": (at_utc if at_utc is not None else datetime.now(_UTC)).isoformat(),
     }
     if details is not None:
         event_payload["details"] = details
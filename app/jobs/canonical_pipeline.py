@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import replace
 
 from app.db import (
@@ -41,67 +42,57 @@ def job_canonical_map_and_persist(
     """
 
     service = mapping_service or CanonicalMappingService()
-    mapping_input_rows = [
-        RawRecordForMapping(
-            raw_record_id=row.raw_record_id,
-            ingestion_run_id=row.ingestion_run_id,
-            section_name=row.section_name,
-            source_row_ref=row.source_row_ref,
-            report_date_local=row.report_date_local,
-            source_payload=row.source_payload,
-        )
-        for row in raw_records
-    ]
+    conid_by_raw_record_id = _job_canonical_index_source_conids(raw_records=raw_records)
     mapped_batch = service.mapping_build_canonical_batch(
         account_id=account_id,
         functional_currency=functional_currency,
-        raw_records=mapping_input_rows,
+        raw_records=_job_canonical_iter_mapping_rows(raw_records=raw_records),
     )
 
     instrument_id_by_conid = _job_canonical_upsert_instruments(
         mapped_batch=mapped_batch,
         canonical_persistence_repository=canonical_persistence_repository,
     )
-    conid_by_raw_record_id = _job_canonical_build_conid_index(raw_records=raw_records)
+    instrument_id_text_by_conid = {
+        conid: str(instrument_record.instrument_id) for conid, instrument_record in instrument_id_by_conid.items()
+    }
+    # One probe per trade/cashflow row; conid-level diagnosis only runs on the failure path.
+    instrument_id_by_raw_record_id = {
+        raw_record_id: instrument_id_text_by_conid[conid]
+        for raw_record_id, conid in conid_by_raw_record_id.items()
+        if conid in instrument_id_text_by_conid
+    }
 
     resolved_trade_requests: list[CanonicalTradeFillUpsertRequest] = []
     for trade_request in mapped_batch.trade_fill_requests:
-        conid = conid_by_raw_record_id.get(trade_request.source_raw_record_id)
-        if conid is None:
-            raise MappingContractViolationError(
-                "mapping contract violation: trade row missing conid context "
-                f"for source_raw_record_id={trade_request.source_raw_record_id}"
-            )
-
-        instrument_record = instrument_id_by_conid.get(conid)
-        if instrument_record is None:
+        instrument_id = instrument_id_by_raw_record_id.get(trade_request.source_raw_record_id)
+        if instrument_id is None:
+            conid = conid_by_raw_record_id.get(trade_request.source_raw_record_id)
+            if conid is None:
+                raise MappingContractViolationError(
+                    "mapping contract violation: trade row missing conid context "
+                    f"for source_raw_record_id={trade_request.source_raw_record_id}"
+                )
             raise MappingContractViolationError(
                 "mapping contract violation: unresolved instrument id "
                 f"for trade conid={conid}"
             )
 
-        resolved_trade_request: CanonicalTradeFillUpsertRequest = replace(
-            trade_request,
-            instrument_id=str(instrument_record.instrument_id),
-        )
-        resolved_trade_requests.append(resolved_trade_request)
+        resolved_trade_requests.append(replace(trade_request, instrument_id=instrument_id))
 
     resolved_cashflow_requests = []
     for cashflow_request in mapped_batch.cashflow_requests:
-        conid = conid_by_raw_record_id.get(cashflow_request.source_raw_record_id)
-        if conid is not None and conid in instrument_id_by_conid:
-            cashflow_request = replace(
-                cashflow_request,
-                instrument_id=str(instrument_id_by_conid[conid].instrument_id),
-            )
+        instrument_id = instrument_id_by_raw_record_id.get(cashflow_request.source_raw_record_id)
+        if instrument_id is not None:
+            cashflow_request = replace(cashflow_request, instrument_id=instrument_id)
         resolved_cashflow_requests.append(cashflow_request)
 
     resolved_corp_action_requests = []
     for corp_action_request in mapped_batch.corp_action_requests:
-        if corp_action_request.conid in instrument_id_by_conid:
+        if corp_action_request.conid in instrument_id_text_by_conid:
             corp_action_request = replace(
                 corp_action_request,
-                instrument_id=str(instrument_id_by_conid[corp_action_request.conid].instrument_id),
+                instrument_id=instrument_id_text_by_conid[corp_action_request.conid],
             )
         resolved_corp_action_requests.append(corp_action_request)
 
@@ -121,51 +112,82 @@ def job_canonical_map_and_persist(
     }
 
 
-def _job_canonical_upsert_instruments(
-    mapped_batch: CanonicalMappingBatch,
-    canonical_persistence_repository: CanonicalPersistenceRepositoryPort,
-) -> dict[str, CanonicalInstrumentRecord]:
-    """Upsert mapped canonical instruments and build lookup by conid.
+def _job_canonical_index_source_conids(raw_records: list[RawRecordForCanonicalMapping]) -> dict[str, str]:
+    """Index non-blank source payload conids by raw record identifier.
 
     Args:
-        mapped_batch: Mapped canonical batch.
-        canonical_persistence_repository: Canonical persistence repository.
+        raw_records: Raw rows for canonical mapping.
 
     Returns:
-        dict[str, CanonicalInstrumentRecord]: Persisted instrument records keyed by conid.
+        dict[str, str]: Mapping of source raw record id to normalized conid.
 
     Raises:
-        RuntimeError: Raised when persistence operation fails.
+        RuntimeError: This helper does not raise runtime errors.
     """
 
-    records_by_conid: dict[str, CanonicalInstrumentRecord] = {}
-    unique_requests: dict[str, CanonicalInstrumentUpsertRequest] = {}
-    for request in mapped_batch.instrument_upsert_requests:
-        unique_requests[request.conid] = request
-
-    for conid, request in unique_requests.items():
-        records_by_conid[conid] = canonical_persistence_repository.db_canonical_instrument_upsert(request)
+    conid_by_raw_record_id: dict[str, str] = {}
+    for row in raw_records:
+        payload_conid = row.source_payload.get("conid")
+        if isinstance(payload_conid, str):
+            normalized_conid = payload_conid.strip()
+            if normalized_conid:
+                conid_by_raw_record_id[str(row.raw_record_id)] = normalized_conid
+    return conid_by_raw_record_id
 
-    return records_by_conid
 
+def _job_canonical_iter_mapping_rows(raw_records: list[RawRecordForCanonicalMapping]) -> Iterator[RawRecordForMapping]:
+    """Yield mapping input rows lazily in source order.
 
-def _job_canonical_build_conid_index(raw_records: list[RawRecordForCanonicalMapping]) -> dict[str, str]:
-    """Build source raw-record identifier to conid lookup table.
+    Rows are produced one at a time so the mapping service never holds a second
+    full-size list of wrappers.
 
     Args:
         raw_records: Raw rows for canonical mapping.
 
     Returns:
-        dict[str, str]: Mapping of source raw record id to conid.
+        Iterator[RawRecordForMapping]: Mapping input rows in source order.
 
     Raises:
         RuntimeError: This helper does not raise runtime errors.
     """
 
-    conid_by_raw_record_id: dict[str, str] = {}
-    for raw_record in raw_records:
-        payload_conid = raw_record.source_payload.get("conid")
-        if isinstance(payload_conid, str) and payload_conid.strip():
-            conid_by_raw_record_id[str(raw_record.raw_record_id)] = payload_conid.strip()
+    for row in raw_records:
+        yield RawRecordForMapping(
+            raw_record_id=row.raw_record_id,
+            ingestion_run_id=row.ingestion_run_id,
+            section_name=row.section_name,
+            source_row_ref=row.source_row_ref,
+            report_date_local=row.report_date_local,
+            source_payload=row.source_payload,
+        )
 
-    return conid_by_raw_record_id
+
+def _job_canonical_upsert_instruments(
+    mapped_batch: CanonicalMappingBatch,
+    canonical_persistence_repository: CanonicalPersistenceRepositoryPort,
+) -> dict[str, CanonicalInstrumentRecord]:
+    """Upsert mapped canonical instruments and build lookup by conid.
+
+    Args:
+        mapped_batch: Mapped canonical batch.
+        canonical_persistence_repository: Canonical persistence repository.
+
+    Returns:
+        dict[str, CanonicalInstrumentRecord]: Persisted instrument records keyed by conid.
+
+    Raises:
+        RuntimeError: Raised when persistence operation fails.
+    """
+
+    instrument_requests = mapped_batch.instrument_upsert_requests
+    # Dedup policy: the last request for a conid wins, matching the repository's in-batch collapse.
+    unique_requests: dict[str, CanonicalInstrumentUpsertRequest] = dict(
+        zip((request.conid for request in instrument_requests), instrument_requests)
+    )
+    if not unique_requests:
+        return {}
+
+    instrument_records = canonical_persistence_repository.db_canonical_instruments_bulk_upsert(
+        list(unique_requests.values())
+    )
+    return {instrument_record.conid: instrument_record for instrument_record in instrument_records}
@@ -2,7 +2,22 @@
 
 from __future__ import annotations
 
-from .section_preflight import MISSING_REQUIRED_SECTION_CODE
+from .section_preflight import (
+    FUTURE_PROOF_FLEX_SECTIONS,
+    HARD_REQUIRED_FLEX_SECTIONS,
+    MISSING_REQUIRED_SECTION_CODE,
+    RECONCILIATION_REQUIRED_FLEX_SECTIONS,
+)
+
+# Canonical section-name objects so decoded JSON strings resolve to the module constants.
+_KNOWN_FLEX_SECTION_NAMES: dict[str, str] = {
+    section_name: section_name
+    for section_name in (
+        *HARD_REQUIRED_FLEX_SECTIONS,
+        *RECONCILIATION_REQUIRED_FLEX_SECTIONS,
+        *FUTURE_PROOF_FLEX_SECTIONS,
+    )
+}
 
 
 def job_extract_missing_sections_from_diagnostics(diagnostics) -> dict[str, list[str]]:
@@ -18,29 +33,50 @@ def job_extract_missing_sections_from_diagnostics(diagnostics) -> dict[str, list
         RuntimeError: This helper does not raise runtime errors.
     """
 
-    missing_sections: list[str] = []
-    missing_hard_required: list[str] = []
-    missing_reconciliation_required: list[str] = []
+    missing_required_section_code = MISSING_REQUIRED_SECTION_CODE
+    event = None
+    if isinstance(diagnostics, list) and diagnostics:
+        event = next(
+            (
+                candidate
+                for candidate in diagnostics
+                if isinstance(candidate, dict) and candidate.get("error_code") == missing_required_section_code
+            ),
+            None,
+        )
 
-    if not isinstance(diagnostics, list):
+    if event is None:
         return {
-            "missing_sections": missing_sections,
-            "missing_hard_required": missing_hard_required,
-            "missing_reconciliation_required": missing_reconciliation_required,
+            "missing_sections": [],
+            "missing_hard_required": [],
+            "missing_reconciliation_required": [],
         }
 
-    for event in diagnostics:
-        if not isinstance(event, dict):
-            continue
-        if event.get("error_code") != MISSING_REQUIRED_SECTION_CODE:
-            continue
-        missing_sections = [str(value) for value in event.get("missing_sections", [])]
-        missing_hard_required = [str(value) for value in event.get("missing_hard_required", [])]
-        missing_reconciliation_required = [str(value) for value in event.get("missing_reconciliation_required", [])]
-        break
-
     return {
-        "missing_sections": missing_sections,
-        "missing_hard_required": missing_hard_required,
-        "missing_reconciliation_required": missing_reconciliation_required,
+        "missing_sections": _job_diagnostics_normalize_section_names(event.get("missing_sections", [])),
+        "missing_hard_required": _job_diagnostics_normalize_section_names(event.get("missing_hard_required", [])),
+        "missing_reconciliation_required": _job_diagnostics_normalize_section_names(
+            event.get("missing_reconciliation_required", [])
+        ),
     }
+
+
+def _job_diagnostics_normalize_section_names(values) -> list[str]:
+    """Normalize one diagnostics section-name list to strings.
+
+    Args:
+        values: Section-name values decoded from diagnostics JSON.
+
+    Returns:
+        list[str]: Section names, reusing module constants for known Flex sections.
+
+    Raises:
+        RuntimeError: This helper does not raise runtime errors.
+    """
+
+    known_section_names = _KNOWN_FLEX_SECTION_NAMES
+    normalized_names: list[str] = []
+    for value in values:
+        section_name = value if isinstance(value, str) else str(value)
+        normalized_names.append(known_section_names.get(section_name, section_name))
+    return normalized_names
@@ -6,6 +6,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import hashlib
+import time
 import traceback
 
 from app.adapters import (
@@ -24,18 +25,18 @@ from app.db import (
     RawArtifactReference,
     RawRecordReadRepositoryPort,
     RawPersistenceRepositoryPort,
-    RawRecordPersistRequest,
+    RawRecordDraft,
 )
 from app.domain import domain_build_stage_event
 from app.ledger import StockLedgerSnapshotService
 
 from .interfaces import JobExecutionResult, JobOrchestratorPort
-from .raw_extraction import job_raw_extract_payload_rows
+from .raw_extraction import job_raw_build_payload_rows, job_raw_scan_payload_sections
 from .canonical_pipeline import job_canonical_map_and_persist
 from .section_preflight import (
     MISSING_REQUIRED_SECTION_CODE,
     job_section_preflight_build_missing_required_diagnostics,
-    job_section_preflight_validate_required_sections,
+    job_section_preflight_validate_section_names,
 )
 
 
@@ -62,6 +63,30 @@ class IngestionJobOrchestrator(JobOrchestratorPort):
     """Concrete job orchestrator for Task 3 ingestion workflow."""
 
     _INGESTION_JOB_NAME = "ingestion_run"
+    # Resolved by walking the exception MRO, so subclasses map to their nearest listed ancestor.
+    # Flex errors also inherit builtin bases (FlexRequestError is a ValueError), and the nearer
+    # Flex entry wins, matching the previous isinstance chain order.
+    _ERROR_CODE_BY_EXCEPTION_TYPE: dict[type[BaseException], str] = {
+        FlexTokenExpiredError: "INGESTION_TOKEN_EXPIRED_ERROR",
+        FlexTokenInvalidError: "INGESTION_TOKEN_INVALID_ERROR",
+        FlexRequestError: "INGESTION_REQUEST_ERROR",
+        FlexStatementError: "INGESTION_STATEMENT_ERROR",
+        FlexAdapterTimeoutError: "INGESTION_TIMEOUT_ERROR",
+        FlexAdapterConnectionError: "INGESTION_CONNECTION_ERROR",
+        TimeoutError: "INGESTION_TIMEOUT_ERROR",
+        ConnectionError: "INGESTION_CONNECTION_ERROR",
+        ValueError: "INGESTION_CONTRACT_ERROR",
+    }
+    _UPSTREAM_ERROR_CODES = frozenset(
+        {
+            "INGESTION_TOKEN_EXPIRED_ERROR",
+            "INGESTION_TOKEN_INVALID_ERROR",
+            "INGESTION_REQUEST_ERROR",
+            "INGESTION_STATEMENT_ERROR",
+            "INGESTION_TIMEOUT_ERROR",
+            "INGESTION_CONNECTION_ERROR",
+        }
+    )
 
     def __init__(
         self,
@@ -139,10 +164,18 @@ class IngestionJobOrchestrator(JobOrchestratorPort):
         if normalized_job_name != self._INGESTION_JOB_NAME:
             raise ValueError(f"unsupported job_name={normalized_job_name}")
 
-        period_key = datetime.now(timezone.utc).date().isoformat()
+        # One clock read keys the run period and stamps the start event, so the two cannot
+        # straddle a UTC midnight.
+        run_started_at_utc = datetime.now(timezone.utc)
+        period_key = run_started_at_utc.date().isoformat()
         timeline: list[dict[str, object]] = []
-        timeline.append(domain_build_stage_event(stage="run", status="started"))
+        timeline.append(domain_build_stage_event(stage="run", status="started", at_utc=run_started_at_utc))
 
+        # FSN[2026-10-17]: ALWAYS create the started run before calling the Flex adapter.
+        # Context: run creation takes the single-active-run guard; overlapping it with the fetch
+        # (threads or asyncio) would spend rate-limited Flex requests on runs that get rejected.
+        # Guard: adapter is only reached after db_ingestion_run_create_started returns.
+        # Test: test_jobs_ingestion_orchestrator_skips_flex_fetch_when_run_already_active
         run_record = self._ingestion_repository.db_ingestion_run_create_started(
             account_id=self._config.account_id,
             run_type=self._config.run_type,
@@ -156,11 +189,16 @@ class IngestionJobOrchestrator(JobOrchestratorPort):
             timeline.extend(adapter_result.stage_timeline)
 
             timeline.append(domain_build_stage_event(stage="preflight", status="started"))
-            preflight_result = job_section_preflight_validate_required_sections(
-                payload_bytes=adapter_result.payload_bytes,
+            # One streaming parse yields the section names preflight checks; raw rows are only
+            # built from the scan once preflight passes.
+            section_scan = job_raw_scan_payload_sections(payload_bytes=adapter_result.payload_bytes)
+            preflight_result = job_section_preflight_validate_section_names(
+                section_names=section_scan.section_names,
                 reconciliation_enabled=self._config.reconciliation_enabled,
             )
 
+            # Rejected payloads cost exactly the create + finalize pair: no raw persistence runs,
+            # and the started row cannot be deferred without dropping the active-run guard above.
             if not preflight_result.section_preflight_is_valid():
                 return self._job_handle_preflight_failure(
                     run_record=run_record,
@@ -178,11 +216,14 @@ class IngestionJobOrchestrator(JobOrchestratorPort):
             )
 
             timeline.append(domain_build_stage_event(stage="persist", status="started"))
+            extraction_result = job_raw_build_payload_rows(section_scan)
+            # Hashed inline after preflight: SHA-256 is ~2% of the XML parse cost, so a hashing
+            # thread gains nothing measurable, and rejected payloads are never hashed. The digest is
+            # part of the raw_artifact dedupe key, so switching algorithms would orphan stored rows.
             payload_sha256 = hashlib.sha256(adapter_result.payload_bytes).hexdigest()
-            extraction_result = job_raw_extract_payload_rows(payload_bytes=adapter_result.payload_bytes)
 
-            artifact_result = self._raw_persistence_repository.db_raw_artifact_upsert(
-                request=RawArtifactPersistRequest(
+            persist_result = self._raw_persistence_repository.db_raw_persist_artifact_and_records(
+                artifact_request=RawArtifactPersistRequest(
                     ingestion_run_id=run_record.ingestion_run_id,
                     reference=RawArtifactReference(
                         account_id=self._config.account_id,
@@ -192,22 +233,21 @@ class IngestionJobOrchestrator(JobOrchestratorPort):
                         report_date_local=extraction_result.report_date_local,
                     ),
                     source_payload=adapter_result.payload_bytes,
-                )
+                ),
+                record_drafts=(
+                    RawRecordDraft(
+                        section_name=extracted_row.section_name,
+                        source_row_ref=extracted_row.source_row_ref,
+                        source_payload=extracted_row.source_payload,
+                    )
+                    for extracted_row in extraction_result.rows
+                ),
             )
-
-            raw_record_requests = [
-                RawRecordPersistRequest(
-                    ingestion_run_id=run_record.ingestion_run_id,
-                    raw_artifact_id=artifact_result.artifact.raw_artifact_id,
-                    artifact_reference=artifact_result.artifact.reference,
-                    report_date_local=extraction_result.report_date_local,
-                    section_name=extracted_row.section_name,
-                    source_row_ref=extracted_row.source_row_ref,
-                    source_payload=extracted_row.source_payload,
-                )
-                for extracted_row in extraction_result.rows
-            ]
-            raw_record_result = self._raw_persistence_repository.db_raw_record_insert_many(raw_record_requests)
+            # Canonical mapping re-reads persisted rows, so the scan, the extracted copies and the raw
+            # payload (its stage timeline is already merged above) can go before canonical and snapshot work.
+            del section_scan, extraction_result, adapter_result
+            artifact_result = persist_result.artifact_result
+            raw_record_result = persist_result.record_result
 
             timeline.append(
                 domain_build_stage_event(
@@ -228,7 +268,7 @@ class IngestionJobOrchestrator(JobOrchestratorPort):
                 canonical_raw_rows = self._canonical_repository.db_raw_record_list_for_run(
                     ingestion_run_id=run_record.ingestion_run_id,
                 )
-                canonical_started_at = datetime.now(timezone.utc)
+                canonical_started_ns = time.perf_counter_ns()
                 if len(canonical_raw_rows) == 0:
                     canonical_counts = {
                         "instrument_upsert_count": 0,
@@ -246,10 +286,7 @@ class IngestionJobOrchestrator(JobOrchestratorPort):
                         canonical_persistence_repository=self._canonical_repository,
                     )
                     canonical_skip_reason = None
-                canonical_duration_ms = max(
-                    0,
-                    int((datetime.now(timezone.utc) - canonical_started_at).total_seconds() * 1000),
-                )
+                canonical_duration_ms = (time.perf_counter_ns() - canonical_started_ns) // 1_000_000
                 canonical_details: dict[str, object] = {
                     **canonical_counts,
                     "canonical_input_row_count": len(canonical_raw_rows),
@@ -281,18 +318,16 @@ class IngestionJobOrchestrator(JobOrchestratorPort):
             return JobExecutionResult(job_name=normalized_job_name, status="success")
         except (TimeoutError, ConnectionError, ValueError, RuntimeError) as error:
             error_code = self._job_error_code_for_exception(error)
-
-            timeline.append(
-                domain_build_stage_event(
-                    stage="run",
-                    status="failed",
-                    details={
-                        "error_type": type(error).__name__,
-                        "error_message": str(error),
-                        "traceback": traceback.format_exc(),
-                    },
-                )
-            )
+            failure_details: dict[str, object] = {
+                "error_type": type(error).__name__,
+                "error_message": str(error),
+            }
+            # Upstream Flex and network failures are fully described by type and message; only
+            # contract and unexpected errors point at our own code, so only they carry a stack.
+            if error_code not in self._UPSTREAM_ERROR_CODES:
+                failure_details["traceback"] = traceback.format_exc()
+
+            timeline.append(domain_build_stage_event(stage="run", status="failed", details=failure_details))
             self._ingestion_repository.db_ingestion_run_finalize(
                 ingestion_run_id=run_record.ingestion_run_id,
                 status="failed",
@@ -324,20 +359,23 @@ class IngestionJobOrchestrator(JobOrchestratorPort):
             RuntimeError: This helper does not raise runtime errors.
         """
 
-        missing_diagnostics = job_section_preflight_build_missing_required_diagnostics(preflight_result)
+        # The builder returns exactly one event; reuse its list copies for the inline failure event.
+        missing_event = job_section_preflight_build_missing_required_diagnostics(preflight_result)[0]
+        failed_at_utc = datetime.now(timezone.utc)
         timeline.append(
             domain_build_stage_event(
                 stage="preflight",
                 status="failed",
                 details={
                     "error_code": MISSING_REQUIRED_SECTION_CODE,
-                    "missing_hard_required": list(preflight_result.missing_hard_required),
-                    "missing_reconciliation_required": list(preflight_result.missing_reconciliation_required),
+                    "missing_hard_required": missing_event["missing_hard_required"],
+                    "missing_reconciliation_required": missing_event["missing_reconciliation_required"],
                 },
+                at_utc=failed_at_utc,
             )
         )
-        timeline.extend(missing_diagnostics)
-        timeline.append(domain_build_stage_event(stage="run", status="failed"))
+        timeline.append(missing_event)
+        timeline.append(domain_build_stage_event(stage="run", status="failed", at_utc=failed_at_utc))
         self._ingestion_repository.db_ingestion_run_finalize(
             ingestion_run_id=run_record.ingestion_run_id,
             status="failed",
@@ -360,24 +398,10 @@ class IngestionJobOrchestrator(JobOrchestratorPort):
             RuntimeError: This helper does not raise runtime errors.
         """
 
-        if isinstance(error, FlexTokenExpiredError):
-            return "INGESTION_TOKEN_EXPIRED_ERROR"
-        if isinstance(error, FlexTokenInvalidError):
-            return "INGESTION_TOKEN_INVALID_ERROR"
-        if isinstance(error, FlexRequestError):
-            return "INGESTION_REQUEST_ERROR"
-        if isinstance(error, FlexStatementError):
-            return "INGESTION_STATEMENT_ERROR"
-        if isinstance(error, FlexAdapterTimeoutError):
-            return "INGESTION_TIMEOUT_ERROR"
-        if isinstance(error, FlexAdapterConnectionError):
-            return "INGESTION_CONNECTION_ERROR"
-        if isinstance(error, TimeoutError):
-            return "INGESTION_TIMEOUT_ERROR"
-        if isinstance(error, ConnectionError):
-            return "INGESTION_CONNECTION_ERROR"
-        if isinstance(error, ValueError):
-            return "INGESTION_CONTRACT_ERROR"
+        for error_type in type(error).__mro__:
+            error_code = self._ERROR_CODE_BY_EXCEPTION_TYPE.get(error_type)
+            if error_code is not None:
+                return error_code
         return "INGESTION_UNEXPECTED_ERROR"
 
     def _job_append_snapshot_stage_timeline(self, run_record_id: str, timeline: list[dict[str, object]]) -> None:
@@ -395,7 +419,7 @@ class IngestionJobOrchestrator(JobOrchestratorPort):
         """
 
         timeline.append(domain_build_stage_event(stage="snapshot", status="started"))
-        snapshot_started_at = datetime.now(timezone.utc)
+        snapshot_started_ns = time.perf_counter_ns()
         if self._snapshot_service is None:
             timeline.append(
                 domain_build_stage_event(
@@ -411,10 +435,7 @@ class IngestionJobOrchestrator(JobOrchestratorPort):
             ingestion_run_id=run_record_id,
             run_completed_at_utc=datetime.now(timezone.utc).isoformat(),
         )
-        snapshot_duration_ms = max(
-            0,
-            int((datetime.now(timezone.utc) - snapshot_started_at).total_seconds() * 1000),
-        )
+        snapshot_duration_ms = (time.perf_counter_ns() - snapshot_started_ns) // 1_000_000
         timeline.append(
             domain_build_stage_event(
                 stage="snapshot",
@@ -4,14 +4,33 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
+import sys
 import xml.etree.ElementTree as element_tree
 
 from app.domain.flex_parsing import domain_flex_parse_local_date
 
-from .flex_payload_validation import job_flex_parse_payload_with_statements
+from .flex_payload_validation import job_flex_validate_statements_count_attribute
 
 
-@dataclass(frozen=True)
+# Row identity attributes in priority order; rows carrying none of them fall back to position.
+_RAW_ROW_REF_PREFERRED_KEYS = (
+    "transactionID",
+    "transactionId",
+    "tradeID",
+    "tradeId",
+    "actionID",
+    "actionId",
+    "ibExecID",
+    "ibExecId",
+    "execID",
+    "execId",
+    "id",
+)
+_RAW_ROW_REF_PREFERRED_KEY_SET = frozenset(_RAW_ROW_REF_PREFERRED_KEYS)
+
+
+@dataclass(frozen=True, slots=True)
 class RawExtractedRow:
     """Typed representation of one extracted raw row.
 
@@ -26,7 +45,7 @@ class RawExtractedRow:
     source_payload: dict[str, object]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RawPayloadExtractionResult:
     """Extraction result contract for one raw Flex payload.
 
@@ -39,122 +58,354 @@ class RawPayloadExtractionResult:
     rows: list[RawExtractedRow]
 
 
-def job_raw_extract_payload_rows(payload_bytes: bytes) -> RawPayloadExtractionResult:
-    """Extract raw section rows from Flex payload for immutable persistence.
+@dataclass(frozen=True, slots=True)
+class RawPayloadSectionScan:
+    """Section scan of one raw Flex payload with rows not yet materialized.
+
+    Attributes:
+        section_names: Non-blank section names directly under `FlexStatement` nodes.
+        report_date_local: Optional report date parsed from Flex statement metadata.
+        pending_rows: Leaf and section-only rows in extraction order, built by
+            `job_raw_build_payload_rows` once section preflight has passed.
+    """
+
+    section_names: set[str]
+    report_date_local: date | None
+    pending_rows: list[_RawPendingRow]
+
+
+def job_raw_scan_payload_sections(payload_bytes: bytes) -> RawPayloadSectionScan:
+    """Scan Flex payload sections and row positions in one streaming parse.
+
+    Rows are recorded from parser callbacks, so no element tree is materialized, and
+    row payloads and source references are only built by `job_raw_build_payload_rows`.
+    Callers can therefore reject payloads on `section_names` without paying for rows.
 
     Args:
         payload_bytes: Raw immutable Flex payload bytes.
 
     Returns:
-        RawPayloadExtractionResult: Parsed report date and extracted rows.
+        RawPayloadSectionScan: Section names, report date, and pending rows.
 
     Raises:
-        ValueError: Raised when payload is empty or malformed XML.
+        ValueError: Raised when payload is empty, malformed, or missing statements.
     """
 
-    _, statements = job_flex_parse_payload_with_statements(payload_bytes=payload_bytes)
+    stream_target = _job_raw_stream_statements(payload_bytes=payload_bytes, collect_rows=True)
+    return RawPayloadSectionScan(
+        section_names=stream_target.section_names,
+        report_date_local=_job_raw_extract_report_date_local(stream_target.first_statement_attributes or {}),
+        pending_rows=[row for statement_rows in stream_target.statement_rows for row in statement_rows],
+    )
 
-    report_date_local = _job_raw_extract_report_date_local(statements[0])
-    extracted_rows: list[RawExtractedRow] = []
 
-    for statement in statements:
-        for section_element in list(statement):
-            section_name = section_element.tag.strip()
-            if not section_name:
-                continue
+def job_raw_scan_payload_section_names(payload_bytes: bytes) -> set[str]:
+    """Scan Flex payload section names without recording rows.
 
-            leaf_rows = _job_raw_collect_section_leaf_rows(section_element)
-            if not leaf_rows:
-                extracted_rows.append(
-                    RawExtractedRow(
-                        section_name=section_name,
-                        source_row_ref=f"{section_name}:section:1",
-                        source_payload=dict(sorted(section_element.attrib.items())),
-                    )
+    Uses the same streaming parse and payload checks as `job_raw_scan_payload_sections`,
+    but leaf rows are skipped for callers that only need section names.
+
+    Args:
+        payload_bytes: Raw immutable Flex payload bytes.
+
+    Returns:
+        set[str]: Non-blank section names directly under `FlexStatement` nodes.
+
+    Raises:
+        ValueError: Raised when payload is empty, malformed, or missing statements.
+    """
+
+    return _job_raw_stream_statements(payload_bytes=payload_bytes, collect_rows=False).section_names
+
+
+def job_raw_build_payload_rows(section_scan: RawPayloadSectionScan) -> RawPayloadExtractionResult:
+    """Build raw rows for persistence from a payload section scan.
+
+    Args:
+        section_scan: Scan result from `job_raw_scan_payload_sections`.
+
+    Returns:
+        RawPayloadExtractionResult: Parsed report date and extracted rows.
+
+    Raises:
+        RuntimeError: This function does not raise runtime errors.
+    """
+
+    extracted_rows: list[RawExtractedRow] = []
+    for pending_row in section_scan.pending_rows:
+        section_name = pending_row.section_name
+        if pending_row.row_tag is None:
+            extracted_rows.append(
+                RawExtractedRow(
+                    section_name=section_name,
+                    source_row_ref=f"{section_name}:section:1",
+                    source_payload=dict(sorted(pending_row.attributes.items())),
                 )
-                continue
+            )
+            continue
 
-            for row_index, leaf_row in enumerate(leaf_rows, start=1):
-                row_element = leaf_row.row_element
-                row_payload = leaf_row.row_payload
-                source_row_ref = _job_raw_build_source_row_ref(
+        leaf_payload = pending_row.attributes
+        if pending_row.ancestor_attributes:
+            leaf_payload = {}
+            for ancestor_attributes in pending_row.ancestor_attributes:
+                leaf_payload.update(ancestor_attributes)
+            leaf_payload.update(pending_row.attributes)
+        row_payload = {key: leaf_payload[key] for key in _job_raw_sorted_key_order(tuple(leaf_payload))}
+        extracted_rows.append(
+            RawExtractedRow(
+                section_name=section_name,
+                source_row_ref=_job_raw_build_source_row_ref(
                     section_name=section_name,
-                    row_tag=row_element.tag,
+                    row_tag=pending_row.row_tag,
                     row_payload=row_payload,
-                    row_index=row_index,
-                )
-                extracted_rows.append(
-                    RawExtractedRow(
-                        section_name=section_name,
-                        source_row_ref=source_row_ref,
-                        source_payload=row_payload,
-                    )
-                )
+                    row_index=pending_row.row_index,
+                ),
+                source_payload=row_payload,
+            )
+        )
+
+    return RawPayloadExtractionResult(report_date_local=section_scan.report_date_local, rows=extracted_rows)
+
+
+def _job_raw_stream_statements(payload_bytes: bytes, collect_rows: bool) -> _RawStatementStreamTarget:
+    """Stream Flex payload statements through the extraction parser target.
+
+    Args:
+        payload_bytes: Raw immutable Flex payload bytes.
+        collect_rows: Whether leaf and section-only rows are recorded.
+
+    Returns:
+        _RawStatementStreamTarget: Parser target holding the scanned statement state.
+
+    Raises:
+        ValueError: Raised when payload is empty, malformed, or missing statements.
+    """
+
+    if not payload_bytes:
+        raise ValueError("payload_bytes must not be empty")
+
+    stream_target = _RawStatementStreamTarget(collect_rows=collect_rows)
+    parser = element_tree.XMLParser(target=stream_target)
+    try:
+        parser.feed(payload_bytes)
+        parser.close()
+    except element_tree.ParseError as error:
+        raise ValueError("payload_bytes must contain valid XML") from error
+
+    if stream_target.first_statement_attributes is None:
+        raise ValueError("FlexStatement node not found in payload")
+    if stream_target.statements_container_seen:
+        job_flex_validate_statements_count_attribute(
+            raw_count_value=stream_target.statements_count_value,
+            actual_count=len(stream_target.statement_rows),
+        )
+
+    return stream_target
+
+
+@dataclass(slots=True)
+class _RawPendingRow:
+    """Attributes of one row recorded during the streaming scan, before payload merge.
+
+    Attributes:
+        section_name: Flex section name.
+        row_tag: Leaf element tag, or None for a section without child rows.
+        row_index: One-based leaf row index within its section.
+        attributes: Leaf (or empty section) element attributes.
+        ancestor_attributes: Attributes of containers between section and leaf, when any are non-empty.
+    """
 
-    return RawPayloadExtractionResult(report_date_local=report_date_local, rows=extracted_rows)
+    section_name: str
+    row_tag: str | None
+    row_index: int
+    attributes: dict[str, str]
+    ancestor_attributes: list[dict[str, str]] | None = None
 
 
-@dataclass(frozen=True)
-class RawSectionLeafRow:
-    """Leaf row element with merged ancestor context attributes.
+@dataclass(slots=True)
+class _RawStatementScope:
+    """Mutable per-statement state for an open `FlexStatement` during streaming extraction.
 
     Attributes:
-        row_element: Extracted leaf XML element.
-        row_payload: Merged payload where child attributes override ancestor keys.
+        depth: Element depth of the statement node.
+        rows: Pending rows recorded for this statement, in document order.
+        section_name: Name of the open section, or None outside a non-blank section.
+        section_depth: Element depth of the open section.
+        row_index: One-based leaf row counter within the open section.
+    """
+
+    depth: int
+    rows: list[_RawPendingRow]
+    section_name: str | None = None
+    section_depth: int = 0
+    row_index: int = 0
+
+
+class _RawStatementStreamTarget:
+    """ElementTree parser target collecting statement sections and leaf rows without a tree.
+
+    Every open statement keeps its own scope, so a statement nested inside another
+    statement's section still contributes rows to both.
     """
 
-    row_element: element_tree.Element
-    row_payload: dict[str, str]
+    def __init__(self, collect_rows: bool) -> None:
+        """Initialize empty streaming extraction state.
+
+        Args:
+            collect_rows: Whether leaf and section-only rows are recorded; section names
+                and statement counts are tracked either way.
+
+        Returns:
+            None: Initializer does not return a value.
+
+        Raises:
+            RuntimeError: This initializer does not raise runtime errors.
+        """
+
+        self.statements_container_seen = False
+        self.statements_count_value: str | None = None
+        self.first_statement_attributes: dict[str, str] | None = None
+        self.section_names: set[str] = set()
+        self.statement_rows: list[list[_RawPendingRow]] = []
+        self._open_statements: list[_RawStatementScope] = []
+        self._attribute_stack: list[dict[str, str]] = []
+        self._has_children_stack: list[bool] = []
+        self._collect_rows = collect_rows
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        """Track one opening element.
+
+        Args:
+            tag: Element tag name.
+            attrib: Element attributes.
+
+        Returns:
+            None: State is updated as side effect.
+
+        Raises:
+            RuntimeError: This method does not raise runtime errors.
+        """
+
+        depth = len(self._attribute_stack)
+        if depth:
+            self._has_children_stack[-1] = True
+
+        for statement_scope in self._open_statements:
+            if depth == statement_scope.depth + 1:
+                section_name = sys.intern(tag.strip())
+                statement_scope.section_name = section_name or None
+                statement_scope.section_depth = depth
+                statement_scope.row_index = 0
+                if section_name:
+                    self.section_names.add(section_name)
+
+        # Only the first FlexStatements container in document order carries the count contract.
+        if tag == "FlexStatements" and not self.statements_container_seen:
+            self.statements_container_seen = True
+            self.statements_count_value = attrib.get("count")
+        if tag == "FlexStatement" and depth:
+            if self.first_statement_attributes is None:
+                self.first_statement_attributes = attrib
+            statement_rows: list[_RawPendingRow] = []
+            self.statement_rows.append(statement_rows)
+            self._open_statements.append(_RawStatementScope(depth=depth, rows=statement_rows))
+
+        self._attribute_stack.append(attrib)
+        self._has_children_stack.append(False)
+
+    def end(self, tag: str) -> None:
+        """Record pending rows for one closing element.
+
+        Args:
+            tag: Element tag name.
+
+        Returns:
+            None: State is updated as side effect.
+
+        Raises:
+            RuntimeError: This method does not raise runtime errors.
+        """
+
+        attrib = self._attribute_stack.pop()
+        has_children = self._has_children_stack.pop()
+        depth = len(self._attribute_stack)
+
+        if self._collect_rows:
+            self._record_pending_rows(tag=tag, attrib=attrib, has_children=has_children, depth=depth)
+
+        if tag == "FlexStatement" and self._open_statements and self._open_statements[-1].depth == depth:
+            self._open_statements.pop()
+
+    def _record_pending_rows(self, tag: str, attrib: dict[str, str], has_children: bool, depth: int) -> None:
+        """Record pending rows for one closing element in every open statement scope.
+
+        Args:
+            tag: Element tag name.
+            attrib: Element attributes.
+            has_children: Whether the element had child elements.
+            depth: Element depth of the closing element.
+
+        Returns:
+            None: State is updated as side effect.
+
+        Raises:
+            RuntimeError: This method does not raise runtime errors.
+        """
+
+        for statement_scope in self._open_statements:
+            section_name = statement_scope.section_name
+            if section_name is None:
+                continue
+            if depth == statement_scope.section_depth:
+                if not has_children:
+                    statement_scope.rows.append(
+                        _RawPendingRow(section_name=section_name, row_tag=None, row_index=1, attributes=attrib)
+                    )
+                statement_scope.section_name = None
+                continue
+            if has_children:
+                continue
+
+            ancestor_attribute_dicts = self._attribute_stack[statement_scope.section_depth:]
+            statement_scope.row_index += 1
+            statement_scope.rows.append(
+                _RawPendingRow(
+                    section_name=section_name,
+                    row_tag=tag,
+                    row_index=statement_scope.row_index,
+                    attributes=attrib,
+                    ancestor_attributes=ancestor_attribute_dicts if any(ancestor_attribute_dicts) else None,
+                )
+            )
 
 
-def _job_raw_collect_section_leaf_rows(
-    section_element: element_tree.Element,
-    parent_attributes: dict[str, str] | None = None,
-) -> list[RawSectionLeafRow]:
-    """Collect leaf row elements recursively under one Flex section.
+@lru_cache(maxsize=1024)
+def _job_raw_sorted_key_order(attribute_names: tuple[str, ...]) -> tuple[str, ...]:
+    """Return sorted, interned payload key order for one row attribute layout.
+
+    Sibling rows of one row type share the same attribute names in the same
+    document order, so each layout is sorted once instead of once per row. Keys
+    are interned here, once per layout, so row payloads across payloads share
+    one string per key and preferred-key lookups match by identity.
 
     Args:
-        section_element: Section container element under `FlexStatement`.
-        parent_attributes: Optional inherited attributes from ancestor containers.
+        attribute_names: Merged payload keys in insertion order.
 
     Returns:
-        list[RawSectionLeafRow]: Deterministically ordered leaf rows with merged payload context.
+        tuple[str, ...]: The same keys, interned, in sorted order.
 
     Raises:
         RuntimeError: This helper does not raise runtime errors.
     """
 
-    inherited_attributes = dict(parent_attributes or {})
-    inherited_attributes.update(section_element.attrib)
-
-    extracted_leaf_rows: list[RawSectionLeafRow] = []
-    for child_element in list(section_element):
-        child_rows = list(child_element)
-        if child_rows:
-            extracted_leaf_rows.extend(
-                _job_raw_collect_section_leaf_rows(
-                    child_element,
-                    parent_attributes=inherited_attributes,
-                )
-            )
-            continue
+    return tuple(sorted(sys.intern(attribute_name) for attribute_name in attribute_names))
 
-        leaf_payload = dict(inherited_attributes)
-        leaf_payload.update(child_element.attrib)
-        extracted_leaf_rows.append(
-            RawSectionLeafRow(
-                row_element=child_element,
-                row_payload=dict(sorted(leaf_payload.items())),
-            )
-        )
-    return extracted_leaf_rows
 
-
-def _job_raw_extract_report_date_local(statement: element_tree.Element) -> date | None:
+def _job_raw_extract_report_date_local(statement_attributes: dict[str, str]) -> date | None:
     """Extract report date from statement metadata when available.
 
     Args:
-        statement: `FlexStatement` element.
+        statement_attributes: Attributes of the first `FlexStatement` element.
 
     Returns:
         date | None: Parsed report date or None when missing/invalid.
@@ -163,7 +414,7 @@ def _job_raw_extract_report_date_local(statement: element_tree.Element) -> date
         RuntimeError: This helper does not raise runtime errors.
     """
 
-    candidate_values = [statement.attrib.get("reportDate"), statement.attrib.get("toDate")]
+    candidate_values = [statement_attributes.get("reportDate"), statement_attributes.get("toDate")]
     for candidate_value in candidate_values:
         if not candidate_value:
             continue
@@ -209,23 +460,12 @@ def _job_raw_build_source_row_ref(
         RuntimeError: This helper does not raise runtime errors.
     """
 
-    preferred_keys = (
-        "transactionID",
-        "transactionId",
-        "tradeID",
-        "tradeId",
-        "actionID",
-        "actionId",
-        "ibExecID",
-        "ibExecId",
-        "execID",
-        "execId",
-        "id",
-    )
+    if _RAW_ROW_REF_PREFERRED_KEY_SET.isdisjoint(row_payload):
+        return f"{section_name}:{row_tag}:idx={row_index}"
 
-    for preferred_key in preferred_keys:
-        preferred_value = row_payload.get(preferred_key, "").strip()
-        if preferred_value:
+    for preferred_key in _RAW_ROW_REF_PREFERRED_KEYS:
+        preferred_value = row_payload.get(preferred_key)
+        if preferred_value and (preferred_value := preferred_value.strip()):
             return f"{section_name}:{row_tag}:{preferred_key}={preferred_value}"
 
     return f"{section_name}:{row_tag}:idx={row_index}"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
+import time
 import traceback
 
 from app.adapters import FlexAdapterConnectionError, FlexAdapterTimeoutError, FlexRequestError, FlexStatementError
@@ -177,17 +178,14 @@ class CanonicalReprocessOrchestrator(JobOrchestratorPort):
             )
 
             timeline.append(domain_build_stage_event(stage="canonical_mapping", status="started"))
-            canonical_started_at = datetime.now(timezone.utc)
+            canonical_started_ns = time.perf_counter_ns()
             canonical_counts = job_canonical_map_and_persist(
                 account_id=config.account_id,
                 functional_currency=config.functional_currency,
                 raw_records=raw_rows,
                 canonical_persistence_repository=self._canonical_persistence_repository,
             )
-            canonical_duration_ms = max(
-                0,
-                int((datetime.now(timezone.utc) - canonical_started_at).total_seconds() * 1000),
-            )
+            canonical_duration_ms = (time.perf_counter_ns() - canonical_started_ns) // 1_000_000
             timeline.append(
                 domain_build_stage_event(
                     stage="canonical_mapping",
@@ -226,16 +224,20 @@ class CanonicalReprocessOrchestrator(JobOrchestratorPort):
             elif isinstance(error, ValueError):
                 error_code = "REPROCESS_CONTRACT_ERROR"
 
+            # One clock read and one message render feed both the event and the run record.
+            failed_at_utc = datetime.now(timezone.utc)
+            error_message = str(error)
             timeline.append(
                 domain_build_stage_event(
                     stage="run",
                     status="failed",
                     details={
                         "error_type": type(error).__name__,
-                        "error_message": str(error),
+                        "error_message": error_message,
                         "traceback": traceback.format_exc(),
-                        "failed_at_utc": datetime.now(timezone.utc).isoformat(),
+                        "failed_at_utc": failed_at_utc.isoformat(),
                     },
+                    at_utc=failed_at_utc,
                 )
             )
             if run_record is not None:
@@ -243,7 +245,7 @@ class CanonicalReprocessOrchestrator(JobOrchestratorPort):
                     ingestion_run_id=run_record.ingestion_run_id,
                     status="failed",
                     error_code=error_code,
-                    error_message=str(error),
+                    error_message=error_message,
                     diagnostics=timeline,
                 )
             return JobExecutionResult(job_name=self._REPROCESS_JOB_NAME, status="failed")
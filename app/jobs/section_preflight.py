@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Final
 
-from .flex_payload_validation import job_flex_parse_payload_with_statements
+from .raw_extraction import job_raw_scan_payload_section_names
 
 MISSING_REQUIRED_SECTION_CODE: Final[str] = "MISSING_REQUIRED_SECTION"
 
@@ -24,6 +24,9 @@ RECONCILIATION_REQUIRED_FLEX_SECTIONS: Final[tuple[str, ...]] = (
     "FIFOPerformanceSummaryInBase",
 )
 
+_HARD_REQUIRED_FLEX_SECTION_SET: Final[frozenset[str]] = frozenset(HARD_REQUIRED_FLEX_SECTIONS)
+_RECONCILIATION_REQUIRED_FLEX_SECTION_SET: Final[frozenset[str]] = frozenset(RECONCILIATION_REQUIRED_FLEX_SECTIONS)
+
 FUTURE_PROOF_FLEX_SECTIONS: Final[tuple[str, ...]] = (
     "InterestAccruals",
     "ChangeInDividendAccruals",
@@ -64,6 +67,18 @@ class SectionPreflightResult:
 
         return not self.missing_hard_required and not self.missing_reconciliation_required
 
+    def section_preflight_missing_sections(self) -> list[str]:
+        """Return all missing required section names.
+
+        Returns:
+            list[str]: Sorted union of hard- and reconciliation-required missing sections.
+
+        Raises:
+            RuntimeError: This method does not raise runtime errors.
+        """
+
+        return sorted(set(self.missing_hard_required).union(self.missing_reconciliation_required))
+
 
 # FSN[2026-02-14]: ALWAYS treat diagnostics payload as JSON array of objects.
 # Context: Task 3 requires structured timeline/error payload in ingestion_run.diagnostics.
@@ -87,9 +102,7 @@ def job_section_preflight_build_missing_required_diagnostics(
     if preflight_result.section_preflight_is_valid():
         raise ValueError("preflight_result must include missing required sections")
 
-    missing_sections = sorted(
-        set(preflight_result.missing_hard_required).union(preflight_result.missing_reconciliation_required)
-    )
+    missing_sections = preflight_result.section_preflight_missing_sections()
     return [
         {
             "stage": "preflight",
@@ -120,15 +133,36 @@ def job_section_preflight_validate_required_sections(
         ValueError: Raised when payload bytes are empty or malformed.
     """
 
-    detected_sections = job_section_preflight_extract_section_names(payload_bytes=payload_bytes)
+    return job_section_preflight_validate_section_names(
+        section_names=job_section_preflight_extract_section_names(payload_bytes=payload_bytes),
+        reconciliation_enabled=reconciliation_enabled,
+    )
+
+
+def job_section_preflight_validate_section_names(
+    section_names: set[str],
+    reconciliation_enabled: bool,
+) -> SectionPreflightResult:
+    """Validate detected section names against frozen required section matrix.
+
+    Args:
+        section_names: Non-blank section names found directly under `FlexStatement` nodes.
+        reconciliation_enabled: Whether reconciliation-required section checks are enforced.
+
+    Returns:
+        SectionPreflightResult: Deterministic section validation result.
+
+    Raises:
+        RuntimeError: This function does not raise runtime errors.
+    """
 
-    missing_hard_required = tuple(sorted(set(HARD_REQUIRED_FLEX_SECTIONS) - detected_sections))
+    missing_hard_required = tuple(sorted(_HARD_REQUIRED_FLEX_SECTION_SET - section_names))
     missing_reconciliation_required = tuple()
     if reconciliation_enabled:
-        missing_reconciliation_required = tuple(sorted(set(RECONCILIATION_REQUIRED_FLEX_SECTIONS) - detected_sections))
+        missing_reconciliation_required = tuple(sorted(_RECONCILIATION_REQUIRED_FLEX_SECTION_SET - section_names))
 
     return SectionPreflightResult(
-        detected_sections=tuple(sorted(detected_sections)),
+        detected_sections=tuple(sorted(section_names)),
         missing_hard_required=missing_hard_required,
         missing_reconciliation_required=missing_reconciliation_required,
     )
@@ -137,6 +171,10 @@ def job_section_preflight_validate_required_sections(
 def job_section_preflight_extract_section_names(payload_bytes: bytes) -> set[str]:
     """Extract section container names from a Flex XML payload.
 
+    Section names come from the streaming raw-extraction parser in names-only mode, so
+    well-formedness and the `FlexStatements` count contract are checked exactly as for
+    raw row persistence without recording any rows.
+
     Args:
         payload_bytes: Raw immutable Flex payload bytes.
 
@@ -144,19 +182,10 @@ def job_section_preflight_extract_section_names(payload_bytes: bytes) -> set[str
         set[str]: Section names detected under `FlexStatement` elements.
 
     Raises:
-        ValueError: Raised when payload is empty or does not contain `FlexStatement`.
+        ValueError: Raised when payload is empty, malformed, or does not contain `FlexStatement`.
     """
 
-    _, statements = job_flex_parse_payload_with_statements(payload_bytes=payload_bytes)
-
-    section_names: set[str] = set()
-    for statement in statements:
-        for section_element in list(statement):
-            section_name = section_element.tag.strip()
-            if section_name:
-                section_names.add(section_name)
-
-    return section_names
+    return job_raw_scan_payload_section_names(payload_bytes=payload_bytes)
 
 
 def job_section_preflight_raise_for_missing_required(preflight_result: SectionPreflightResult) -> None:
@@ -175,8 +204,6 @@ def job_section_preflight_raise_for_missing_required(preflight_result: SectionPr
     if preflight_result.section_preflight_is_valid():
         return
 
-    missing_sections = sorted(
-        set(preflight_result.missing_hard_required).union(preflight_result.missing_reconciliation_required)
-    )
+    missing_sections = preflight_result.section_preflight_missing_sections()
     message = f"{MISSING_REQUIRED_SECTION_CODE}: missing sections={', '.join(missing_sections)}"
     raise MissingRequiredSectionError(message)
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
+
+
+_FIFO_ZERO = Decimal("0")
+# Lot direction opened and lot direction closed by each normalized trade side.
+_FIFO_DIRECTIONS_BY_SIDE = {"BUY": ("long", "short"), "SELL": ("short", "long")}
 
 
 @dataclass(frozen=True)
@@ -93,7 +100,7 @@ class FifoOpenLotResult:
     realized_pnl_to_date: Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class _OpenFifoLot:
     """Mutable internal lot state used during FIFO processing."""
 
@@ -139,29 +146,29 @@ def fifo_compute_instrument(request: FifoLedgerComputationRequest) -> FifoLedger
         ),
     )
 
-    open_lots: list[_OpenFifoLot] = []
-    realized_pnl = Decimal("0")
+    open_lots: deque[_OpenFifoLot] = deque()
+    realized_pnl = _FIFO_ZERO
 
     for trade in sorted_trades:
         side = trade.side.strip().upper()
         quantity = abs(trade.quantity)
-        if quantity == Decimal("0"):
+        if quantity == _FIFO_ZERO:
             continue
 
-        trade_fees = trade.fees or Decimal("0")
-        trade_withholding = trade.withholding_tax or Decimal("0")
+        trade_fees = trade.fees or _FIFO_ZERO
+        trade_withholding = trade.withholding_tax or _FIFO_ZERO
 
-        if side not in {"BUY", "SELL"}:
+        directions = _FIFO_DIRECTIONS_BY_SIDE.get(side)
+        if directions is None:
             raise ValueError(f"unsupported trade side={trade.side}")
 
-        opens_direction = "long" if side == "BUY" else "short"
-        closes_direction = "short" if opens_direction == "long" else "long"
+        opens_direction, closes_direction = directions
 
         quantity_to_close = quantity
-        matched_quantity = Decimal("0")
-        matched_realized = Decimal("0")
+        matched_quantity = _FIFO_ZERO
+        matched_realized = _FIFO_ZERO
 
-        while quantity_to_close > Decimal("0") and open_lots and open_lots[0].direction == closes_direction:
+        while quantity_to_close > _FIFO_ZERO and open_lots and open_lots[0].direction == closes_direction:
             current_lot = open_lots[0]
             close_quantity = min(quantity_to_close, current_lot.remaining_quantity)
             if closes_direction == "long":
@@ -175,16 +182,16 @@ def fifo_compute_instrument(request: FifoLedgerComputationRequest) -> FifoLedger
             quantity_to_close -= close_quantity
             matched_quantity += close_quantity
 
-            if current_lot.remaining_quantity == Decimal("0"):
-                open_lots.pop(0)
+            if current_lot.remaining_quantity == _FIFO_ZERO:
+                open_lots.popleft()
 
-        if matched_quantity > Decimal("0"):
-            fee_ratio = matched_quantity / quantity if quantity != Decimal("0") else Decimal("0")
+        if matched_quantity > _FIFO_ZERO:
+            fee_ratio = matched_quantity / quantity if quantity != _FIFO_ZERO else _FIFO_ZERO
             allocated_close_fees = (trade_fees + trade_withholding) * fee_ratio
             realized_pnl += matched_realized - allocated_close_fees
 
-        if quantity_to_close > Decimal("0"):
-            open_fee_ratio = quantity_to_close / quantity if quantity != Decimal("0") else Decimal("0")
+        if quantity_to_close > _FIFO_ZERO:
+            open_fee_ratio = quantity_to_close / quantity if quantity != _FIFO_ZERO else _FIFO_ZERO
             allocated_open_fees = (trade_fees + trade_withholding) * open_fee_ratio
             if opens_direction == "long":
                 unit_basis = ((trade.price * quantity_to_close) + allocated_open_fees) / quantity_to_close
@@ -208,43 +215,48 @@ def fifo_compute_instrument(request: FifoLedgerComputationRequest) -> FifoLedger
                     cost_basis_open=unit_basis * signed_open_quantity,
                     remaining_quantity=quantity_to_close,
                     unit_basis=unit_basis,
-                    realized_pnl_to_date=Decimal("0"),
+                    realized_pnl_to_date=_FIFO_ZERO,
                 )
             )
 
-    open_quantity = sum(
-        (lot.remaining_quantity if lot.direction == "long" else -lot.remaining_quantity)
-        for lot in open_lots
-    )
-    unrealized_pnl = sum(
-        (
-            (request.mark_price - lot.unit_basis) * lot.remaining_quantity
-            if lot.direction == "long"
-            else (lot.unit_basis - request.mark_price) * lot.remaining_quantity
-        )
-        for lot in open_lots
-    )
-
-    return FifoLedgerComputationResult(
-        position_quantity=open_quantity,
-        realized_pnl=realized_pnl,
-        unrealized_pnl=unrealized_pnl,
-        open_lots=tuple(
+    # One pass over the remaining book yields position, unrealized PnL, and the lot results.
+    open_quantity = _FIFO_ZERO
+    unrealized_pnl = _FIFO_ZERO
+    open_lot_results: list[FifoOpenLotResult] = []
+    for lot in open_lots:
+        if lot.direction == "long":
+            signed_open_quantity = lot.open_quantity
+            signed_remaining_quantity = lot.remaining_quantity
+            unrealized_pnl += (request.mark_price - lot.unit_basis) * lot.remaining_quantity
+        else:
+            signed_open_quantity = -lot.open_quantity
+            signed_remaining_quantity = -lot.remaining_quantity
+            unrealized_pnl += (lot.unit_basis - request.mark_price) * lot.remaining_quantity
+        open_quantity += signed_remaining_quantity
+        open_lot_results.append(
             FifoOpenLotResult(
                 open_event_trade_fill_id=lot.open_event_trade_fill_id,
                 source_raw_record_id=lot.source_raw_record_id,
                 opened_at_utc=lot.opened_at_utc,
-                open_quantity=lot.open_quantity if lot.direction == "long" else -lot.open_quantity,
-                remaining_quantity=lot.remaining_quantity if lot.direction == "long" else -lot.remaining_quantity,
+                open_quantity=signed_open_quantity,
+                remaining_quantity=signed_remaining_quantity,
                 open_price=lot.open_price,
                 cost_basis_open=lot.cost_basis_open,
                 realized_pnl_to_date=lot.realized_pnl_to_date,
             )
-            for lot in open_lots
-        ),
+        )
+
+    return FifoLedgerComputationResult(
+        position_quantity=open_quantity,
+        realized_pnl=realized_pnl,
+        unrealized_pnl=unrealized_pnl,
+        open_lots=tuple(open_lot_results),
     )
 
 
+# Every snapshot recomputes FIFO over the full fill history, so a long-lived process re-parses the
+# same fill timestamps each run; `datetime` results are immutable and failed parses are not cached.
+@lru_cache(maxsize=16384)
 def _fifo_parse_timestamp_utc(timestamp_value: str) -> datetime:
     """Parse UTC timestamp for deterministic FIFO sorting.
 
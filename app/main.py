@@ -13,7 +13,7 @@ from app.bootstrap import (
     bootstrap_create_reprocess_orchestrator,
 )
 from app.config import config_load_settings
-from app.db import SQLAlchemyIngestionRunService, db_create_engine
+from app.db import SQLAlchemyIngestionRunService, db_create_engine_from_settings
 from app.jobs import job_extract_missing_sections_from_diagnostics
 
 
@@ -88,7 +88,7 @@ def main_print_latest_missing_sections_diagnostics() -> None:
     """
 
     settings = config_load_settings()
-    engine = db_create_engine(database_url=settings.database_url)
+    engine = db_create_engine_from_settings(settings)
     repository = SQLAlchemyIngestionRunService(engine=engine)
     latest_runs = repository.db_ingestion_run_list(limit=1, offset=0)
     if not latest_runs:
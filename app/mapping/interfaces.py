@@ -1,5 +1,6 @@
 """Typed interfaces for mapping-layer transformations."""
 
+from collections.abc import Iterable
 from datetime import date
 from dataclasses import dataclass
 from typing import Protocol
@@ -101,14 +102,14 @@ class MappingPort(Protocol):
         self,
         account_id: str,
         functional_currency: str,
-        raw_records: list[RawRecordForMapping],
+        raw_records: Iterable[RawRecordForMapping],
     ) -> CanonicalMappingBatch:
         """Map raw rows into canonical event UPSERT requests.
 
         Args:
             account_id: Internal account context identifier.
             functional_currency: Functional/base reporting currency code.
-            raw_records: Raw rows to map.
+            raw_records: Raw rows to map, consumed in one pass.
 
         Returns:
             CanonicalMappingBatch: Grouped canonical event upsert requests.
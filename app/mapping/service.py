@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
 from datetime import date
@@ -96,14 +97,14 @@ class CanonicalMappingService:
         self,
         account_id: str,
         functional_currency: str,
-        raw_records: list[RawRecordForMapping],
+        raw_records: Iterable[RawRecordForMapping],
     ) -> CanonicalMappingBatch:
         """Map raw rows into canonical event UPSERT requests.
 
         Args:
             account_id: Internal account context identifier.
             functional_currency: Functional/base reporting currency code.
-            raw_records: Raw rows to map.
+            raw_records: Raw rows to map, consumed in one pass.
 
         Returns:
             CanonicalMappingBatch: Grouped canonical event upsert requests.
@@ -600,12 +601,13 @@ class CanonicalMappingService:
         """
 
         value = payload.get(key)
-        if not isinstance(value, str) or not value.strip():
+        normalized_value = value.strip() if isinstance(value, str) else ""
+        if not normalized_value:
             raise MappingContractViolationError(
                 "mapping contract violation: "
                 f"missing required field {key} for {raw_record.section_name} at {raw_record.source_row_ref}"
             )
-        return value.strip()
+        return normalized_value
 
     def _mapping_optional_value(self, payload: dict[str, object], key: str) -> str | None:
         """Extract optional normalized string value from source payload.
@@ -746,14 +748,14 @@ class CanonicalMappingService:
 def mapping_build_canonical_batch(
     account_id: str,
     functional_currency: str,
-    raw_records: list[RawRecordForMapping],
+    raw_records: Iterable[RawRecordForMapping],
 ) -> CanonicalMappingBatch:
     """Map raw rows into canonical event UPSERT requests.
 
     Args:
         account_id: Internal account context identifier.
         functional_currency: Functional/base reporting currency code.
-        raw_records: Raw rows to map.
+        raw_records: Raw rows to map, consumed in one pass.
 
     Returns:
         CanonicalMappingBatch: Grouped canonical event upsert requests.
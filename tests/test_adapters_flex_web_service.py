@@ -431,3 +431,85 @@ def test_adapters_flex_request_stage_persists_normalized_send_request_timestamp(
     details = request_completed_event.get("details")
     assert isinstance(details, dict)
     assert details["broker_request_at_utc"] == "2026-02-20T19:15:00+00:00"
+
+
+def test_adapters_flex_poll_returns_statement_detected_from_leading_elements(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Return a statement payload classified from its root and direct children.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+
+    Returns:
+        None: Assertions validate statement detection and download diagnostics.
+
+    Raises:
+        AssertionError: Raised when a statement payload is not returned as XML.
+    """
+
+    adapter = FlexWebServiceAdapter(token="token", initial_wait_seconds=0, retry_attempts=1)
+
+    request_success_payload = (
+        b"<FlexStatementResponse><Status>Success</Status><ReferenceCode>REF123</ReferenceCode>"
+        b"<Url>https://example.test/GetStatement</Url></FlexStatementResponse>"
+    )
+    statement_rows = b"".join(b"<Trade id=\"%d\" />" % index for index in range(50))
+    statement_payload = (
+        b"<FlexQueryResponse><FlexStatements count=\"1\"><FlexStatement><Trades>"
+        + statement_rows
+        + b"</Trades></FlexStatement></FlexStatements></FlexQueryResponse>"
+    )
+    payload_sequence = [request_success_payload, statement_payload]
+
+    def _fake_http_get(url: str, query_parameters: dict[str, str]) -> bytes:
+        _ = (url, query_parameters)
+        return payload_sequence.pop(0)
+
+    monkeypatch.setattr(adapter, "_adapter_http_get", _fake_http_get)
+
+    result = adapter.adapter_fetch_report(query_id="query-id")
+
+    assert result.payload_bytes == statement_payload
+    download_events = [event for event in result.stage_timeline if event["stage"] == "download"]
+    assert download_events == [
+        {
+            "stage": "download",
+            "status": "completed",
+            "at_utc": download_events[0]["at_utc"],
+            "details": {"poll_attempt": 1},
+        }
+    ]
+
+
+def test_adapters_flex_poll_marks_truncated_statement_as_non_xml(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Record non-XML download diagnostics for a statement truncated after its leading elements.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+
+    Returns:
+        None: Assertions validate malformed statement classification.
+
+    Raises:
+        AssertionError: Raised when truncated statement payload is treated as well-formed XML.
+    """
+
+    adapter = FlexWebServiceAdapter(token="token", initial_wait_seconds=0, retry_attempts=1)
+
+    request_success_payload = (
+        b"<FlexStatementResponse><Status>Success</Status><ReferenceCode>REF123</ReferenceCode>"
+        b"<Url>https://example.test/GetStatement</Url></FlexStatementResponse>"
+    )
+    truncated_statement_payload = b"<FlexQueryResponse><FlexStatements count=\"1\"><FlexStatement><Trades><Trade"
+    payload_sequence = [request_success_payload, truncated_statement_payload]
+
+    def _fake_http_get(url: str, query_parameters: dict[str, str]) -> bytes:
+        _ = (url, query_parameters)
+        return payload_sequence.pop(0)
+
+    monkeypatch.setattr(adapter, "_adapter_http_get", _fake_http_get)
+
+    result = adapter.adapter_fetch_report(query_id="query-id")
+
+    assert result.payload_bytes == truncated_statement_payload
+    download_events = [event for event in result.stage_timeline if event["stage"] == "download"]
+    assert download_events[0]["details"] == {"poll_attempt": 1, "payload_format": "non_xml"}
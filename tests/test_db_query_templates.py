@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from collections.abc import Iterator
+from datetime import date, datetime, timezone
+import json
 from uuid import uuid4
 
+import pytest
+
 from app.db.canonical_persistence import SQLAlchemyCanonicalPersistenceService
 from app.db.ingestion_run import SQLAlchemyIngestionRunService
+from app.db.interfaces import (
+    CanonicalInstrumentUpsertRequest,
+    RawArtifactPersistRequest,
+    RawArtifactReference,
+    RawRecordDraft,
+    RawRecordPersistRequest,
+)
 from app.db.ledger_snapshot import SQLAlchemyLedgerSnapshotService
+from app.db.raw_persistence import SQLAlchemyRawPersistenceService
 
 
 class _MappingResultStub:
@@ -52,6 +64,42 @@ class _MappingResultStub:
 
         return self._rows
 
+    def __iter__(self) -> Iterator[dict]:
+        """Iterate row mappings in query order.
+
+        Returns:
+            Iterator[dict]: Query rows.
+
+        Raises:
+            RuntimeError: This stub does not raise runtime errors.
+        """
+
+        return iter(self._rows)
+
+    def fetchone(self) -> dict | None:
+        """Return the first row mapping when present.
+
+        Returns:
+            dict | None: First query row or None.
+
+        Raises:
+            RuntimeError: This stub does not raise runtime errors.
+        """
+
+        return self._rows[0] if self._rows else None
+
+    def first(self) -> dict | None:
+        """Return the first row mapping when present.
+
+        Returns:
+            dict | None: First query row or None.
+
+        Raises:
+            RuntimeError: This stub does not raise runtime errors.
+        """
+
+        return self._rows[0] if self._rows else None
+
 
 class _ConnectionStub:
     """Connection stub capturing executed SQL and parameters."""
@@ -70,6 +118,7 @@ class _ConnectionStub:
         """
 
         self._rows = rows
+        self.executed_statements: list = []
         self.executed_queries: list[str] = []
         self.executed_parameters: list[dict] = []
 
@@ -118,6 +167,7 @@ class _ConnectionStub:
         """
 
         statement_text = getattr(statement, "text", str(statement))
+        self.executed_statements.append(statement)
         self.executed_queries.append(statement_text)
         self.executed_parameters.append(parameters)
         return _MappingResultStub(rows=self._rows)
@@ -231,8 +281,10 @@ def test_db_canonical_raw_record_list_for_period_uses_fixed_query_template() ->
     connection = _ConnectionStub(rows=[_build_raw_record_row()])
     service = SQLAlchemyCanonicalPersistenceService(engine=_EngineStub(connection=connection))
 
-    service.db_raw_record_list_for_period(account_id="U_TEST", period_key="2026-02-20", flex_query_id="query")
+    raw_records = service.db_raw_record_list_for_period(account_id="U_TEST", period_key="2026-02-20", flex_query_id="query")
 
+    assert [raw_record.source_row_ref for raw_record in raw_records] == ["Trades:Trade:transactionID=1"]
+    assert raw_records[0].source_payload == {"symbol": "AAPL"}
     executed_query = connection.executed_queries[0]
     assert "WHERE account_id = :account_id AND period_key = :period_key AND flex_query_id = :flex_query_id" in executed_query
     assert "ORDER BY created_at_utc ASC, raw_record_id ASC" in executed_query
@@ -345,3 +397,303 @@ def test_db_snapshot_list_uses_typed_nullable_date_predicates() -> None:
     executed_query = connection.executed_queries[0]
     assert "CAST(:report_date_from AS date) IS NULL" in executed_query
     assert "CAST(:report_date_to AS date) IS NULL" in executed_query
+
+
+def test_db_raw_record_insert_many_uses_single_recordset_parameter() -> None:
+    """Insert raw rows through one jsonb recordset parameter and count RETURNING rows.
+
+    Returns:
+        None: Assertions validate SQL template and counter derivation.
+
+    Raises:
+        AssertionError: Raised when bulk insert shape or counters diverge.
+    """
+
+    connection = _ConnectionStub(rows=[{"raw_record_id": uuid4()}])
+    service = SQLAlchemyRawPersistenceService(engine=_EngineStub(connection=connection))
+    artifact_reference = RawArtifactReference(
+        account_id="U_TEST",
+        period_key="2026-02-20",
+        flex_query_id="query",
+        payload_sha256="sha256",
+        report_date_local=date(2026, 2, 20),
+    )
+    raw_artifact_id = uuid4()
+    ingestion_run_id = uuid4()
+    requests = [
+        RawRecordPersistRequest(
+            ingestion_run_id=ingestion_run_id,
+            raw_artifact_id=raw_artifact_id,
+            artifact_reference=artifact_reference,
+            report_date_local=date(2026, 2, 20),
+            section_name="Trades",
+            source_row_ref=f"Trades:Trade:transactionID={index}",
+            source_payload={"transactionID": str(index)},
+        )
+        for index in (1, 2)
+    ]
+
+    result = service.db_raw_record_insert_many(requests)
+
+    executed_query = connection.executed_queries[0]
+    assert len(connection.executed_queries) == 1
+    assert "FROM jsonb_to_recordset(CAST(:rows AS jsonb))" in executed_query
+    assert "RETURNING raw_record_id" in executed_query
+    recordset_rows = json.loads(connection.executed_parameters[0]["rows"])
+    assert [row["source_row_ref"] for row in recordset_rows] == [
+        "Trades:Trade:transactionID=1",
+        "Trades:Trade:transactionID=2",
+    ]
+    assert recordset_rows[0]["raw_artifact_id"] == str(raw_artifact_id)
+    assert recordset_rows[0]["report_date_local"] == "2026-02-20"
+    assert recordset_rows[0]["source_payload"] == {"transactionID": "1"}
+    assert result.inserted_count == 1
+    assert result.deduplicated_count == 1
+
+
+def test_db_raw_artifact_upsert_resolves_dedupe_in_one_statement() -> None:
+    """Resolve inserted-or-existing raw artifact with one race-free upsert statement.
+
+    Returns:
+        None: Assertions validate SQL template and dedupe flag mapping.
+
+    Raises:
+        AssertionError: Raised when upsert shape or dedupe mapping diverges.
+    """
+
+    now_utc = datetime.now(timezone.utc)
+    ingestion_run_id = uuid4()
+    connection = _ConnectionStub(
+        rows=[
+            (
+                uuid4(),
+                ingestion_run_id,
+                "U_TEST",
+                "2026-02-20",
+                "query",
+                "sha256",
+                None,
+                now_utc,
+                False,
+            )
+        ]
+    )
+    service = SQLAlchemyRawPersistenceService(engine=_EngineStub(connection=connection))
+
+    result = service.db_raw_artifact_upsert(
+        RawArtifactPersistRequest(
+            ingestion_run_id=ingestion_run_id,
+            reference=RawArtifactReference(
+                account_id="U_TEST",
+                period_key="2026-02-20",
+                flex_query_id="query",
+                payload_sha256="sha256",
+                report_date_local=None,
+            ),
+            source_payload=b"<FlexQueryResponse/>",
+        )
+    )
+
+    executed_query = connection.executed_queries[0]
+    assert len(connection.executed_queries) == 1
+    assert executed_query.startswith("INSERT INTO raw_artifact")
+    assert "DO UPDATE SET created_at_utc = raw_artifact.created_at_utc" in executed_query
+    assert (
+        "RETURNING raw_artifact_id, ingestion_run_id, account_id, period_key, flex_query_id, payload_sha256, "
+        "report_date_local, created_at_utc, (xmax = 0) AS inserted"
+    ) in executed_query
+    assert result.artifact.source_payload == b"<FlexQueryResponse/>"
+    assert connection.executed_statements[0] is SQLAlchemyRawPersistenceService._SQL_RAW_ARTIFACT_UPSERT
+    assert result.deduplicated is True
+    assert result.artifact.reference.payload_sha256 == "sha256"
+
+
+def test_db_raw_persist_artifact_and_records_uses_one_transaction() -> None:
+    """Persist artifact and its raw rows on one transaction connection.
+
+    Returns:
+        None: Assertions validate statement order and artifact id propagation.
+
+    Raises:
+        AssertionError: Raised when combined persistence shape diverges.
+    """
+
+    raw_artifact_id = uuid4()
+    ingestion_run_id = uuid4()
+    connection = _ConnectionStub(
+        rows=[
+            (
+                raw_artifact_id,
+                ingestion_run_id,
+                "U_TEST",
+                "2026-02-20",
+                "query",
+                "sha256",
+                date(2026, 2, 20),
+                datetime.now(timezone.utc),
+                True,
+            )
+        ]
+    )
+    service = SQLAlchemyRawPersistenceService(engine=_EngineStub(connection=connection))
+
+    result = service.db_raw_persist_artifact_and_records(
+        artifact_request=RawArtifactPersistRequest(
+            ingestion_run_id=ingestion_run_id,
+            reference=RawArtifactReference(
+                account_id="U_TEST",
+                period_key="2026-02-20",
+                flex_query_id="query",
+                payload_sha256="sha256",
+                report_date_local=date(2026, 2, 20),
+            ),
+            source_payload=b"<FlexQueryResponse/>",
+        ),
+        record_drafts=(
+            RawRecordDraft(
+                section_name="Trades",
+                source_row_ref=f"Trades:Trade:transactionID={index}",
+                source_payload={"transactionID": str(index)},
+            )
+            for index in (1, 2)
+        ),
+    )
+
+    assert connection.executed_statements == [
+        SQLAlchemyRawPersistenceService._SQL_RAW_ARTIFACT_UPSERT,
+        SQLAlchemyRawPersistenceService._SQL_RAW_RECORD_INSERT_FOR_ARTIFACT,
+    ]
+    record_parameters = connection.executed_parameters[1]
+    assert record_parameters["raw_artifact_id"] == str(raw_artifact_id)
+    assert record_parameters["report_date_local"] == "2026-02-20"
+    recordset_rows = json.loads(record_parameters["rows"])
+    assert recordset_rows[1] == {
+        "section_name": "Trades",
+        "source_row_ref": "Trades:Trade:transactionID=2",
+        "source_payload": {"transactionID": "2"},
+    }
+    assert result.artifact_result.deduplicated is False
+    assert result.record_result.inserted_count == 1
+    assert result.record_result.deduplicated_count == 1
+
+
+def test_db_canonical_instruments_bulk_upsert_uses_single_recordset_statement() -> None:
+    """Upsert unique instruments with one recordset statement and last-request-wins dedupe.
+
+    Returns:
+        None: Assertions validate SQL template, dedupe, and record mapping.
+
+    Raises:
+        AssertionError: Raised when batched instrument upsert shape diverges.
+    """
+
+    instrument_id = uuid4()
+    connection = _ConnectionStub(rows=[(instrument_id, "U_TEST", "265598")])
+    service = SQLAlchemyCanonicalPersistenceService(engine=_EngineStub(connection=connection))
+
+    records = service.db_canonical_instruments_bulk_upsert(
+        [
+            CanonicalInstrumentUpsertRequest(
+                account_id="U_TEST",
+                conid="265598",
+                symbol=symbol,
+                local_symbol=None,
+                isin=None,
+                cusip=None,
+                figi=None,
+                asset_category="STK",
+                currency="USD",
+                description=None,
+            )
+            for symbol in ("AAPL_OLD", "AAPL")
+        ]
+    )
+
+    executed_query = connection.executed_queries[0]
+    assert len(connection.executed_queries) == 1
+    assert "FROM jsonb_to_recordset(CAST(:rows AS jsonb))" in executed_query
+    assert "ON CONFLICT (account_id, conid) DO UPDATE SET" in executed_query
+    recordset_rows = json.loads(connection.executed_parameters[0]["rows"])
+    assert [row["symbol"] for row in recordset_rows] == ["AAPL"]
+    assert [(record.instrument_id, record.conid) for record in records] == [(instrument_id, "265598")]
+
+
+def test_raw_persist_requests_normalize_identity_fields_at_construction() -> None:
+    """Validate and strip raw identity fields once when requests are built.
+
+    Returns:
+        None: Assertions validate construction-time normalization and errors.
+
+    Raises:
+        AssertionError: Raised when normalization or validation diverges.
+    """
+
+    artifact_reference = RawArtifactReference(
+        account_id=" U_TEST ",
+        period_key="2026-02-20",
+        flex_query_id="query",
+        payload_sha256="sha256",
+        report_date_local=None,
+    )
+    request = RawRecordPersistRequest(
+        ingestion_run_id=uuid4(),
+        raw_artifact_id=uuid4(),
+        artifact_reference=artifact_reference,
+        report_date_local=None,
+        section_name=" Trades ",
+        source_row_ref="Trades:Trade:transactionID=1",
+        source_payload={},
+    )
+
+    assert artifact_reference.account_id == "U_TEST"
+    assert request.section_name == "Trades"
+    with pytest.raises(ValueError, match="reference.payload_sha256 must not be blank"):
+        RawArtifactReference(
+            account_id="U_TEST",
+            period_key="2026-02-20",
+            flex_query_id="query",
+            payload_sha256="  ",
+            report_date_local=None,
+        )
+    with pytest.raises(ValueError, match="request.source_row_ref must not be blank"):
+        RawRecordPersistRequest(
+            ingestion_run_id=uuid4(),
+            raw_artifact_id=uuid4(),
+            artifact_reference=artifact_reference,
+            report_date_local=None,
+            section_name="Trades",
+            source_row_ref="",
+            source_payload={},
+        )
+
+
+def test_db_ingestion_run_finalize_serializes_compact_diagnostics() -> None:
+    """Bind finalize diagnostics as compact JSON without ASCII escaping.
+
+    Returns:
+        None: Assertions validate diagnostics parameter encoding.
+
+    Raises:
+        AssertionError: Raised when diagnostics serialization changes shape.
+    """
+
+    run_row = _build_ingestion_run_row()
+    connection = _ConnectionStub(rows=[run_row])
+    service = SQLAlchemyIngestionRunService(engine=_EngineStub(connection=connection))
+    diagnostics = [{"stage": "run", "status": "failed", "details": {"error_message": "Überweisung"}}]
+
+    finalized_record = service.db_ingestion_run_finalize(
+        ingestion_run_id=run_row["ingestion_run_id"],
+        status="failed",
+        error_code="INGESTION_UNEXPECTED_ERROR",
+        error_message="boom",
+        diagnostics=diagnostics,
+    )
+
+    diagnostics_parameter = connection.executed_parameters[0]["diagnostics"]
+    assert diagnostics_parameter == '[{"stage":"run","status":"failed","details":{"error_message":"Überweisung"}}]'
+    assert json.loads(diagnostics_parameter) == diagnostics
+    assert len(connection.executed_queries) == 1
+    assert "RETURNING" in connection.executed_queries[0]
+    assert finalized_record.state.diagnostics == diagnostics
+    assert finalized_record.state.diagnostics is not diagnostics
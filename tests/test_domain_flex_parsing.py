@@ -91,3 +91,40 @@ def test_domain_flex_parse_timestamp_to_utc_iso_returns_none_for_invalid_values(
 
     assert domain_flex_parse_timestamp_to_utc_iso("") is None
     assert domain_flex_parse_timestamp_to_utc_iso("2026/02/14 10:00:00") is None
+
+
+def test_domain_flex_parse_shape_fast_paths_match_fallback_contract() -> None:
+    """Keep shape-dispatched parsing aligned with the full fallback contract.
+
+    Returns:
+        None: Assertions validate fast-path parsing and invalid-shape fallbacks.
+
+    Raises:
+        AssertionError: Raised when fast-path parsing diverges from contract.
+    """
+
+    assert domain_flex_parse_local_date("2026-02-14;10:15:00") == date(2026, 2, 14)
+    assert domain_flex_parse_local_date("2026/02/14 10:15:00") == date(2026, 2, 14)
+    assert domain_flex_parse_local_date("20260230") is None
+    assert domain_flex_parse_local_date("2026-13-01") is None
+    assert domain_flex_parse_timestamp_to_utc_iso("2026-02-14,10:15:00") == "2026-02-14T10:15:00+00:00"
+    assert domain_flex_parse_timestamp_to_utc_iso("20260214;256000") is None
+
+
+def test_domain_flex_parse_local_date_memoizes_repeated_values() -> None:
+    """Serve repeated date texts from the parse memo with identical results.
+
+    Returns:
+        None: Assertions validate memoized parsing results.
+
+    Raises:
+        AssertionError: Raised when repeated parses diverge or bypass the memo.
+    """
+
+    first_result = domain_flex_parse_local_date("02/15/2026")
+    hits_before = domain_flex_parse_local_date.cache_info().hits
+
+    assert domain_flex_parse_local_date("02/15/2026") == first_result == date(2026, 2, 15)
+    assert domain_flex_parse_local_date.cache_info().hits == hits_before + 1
+    assert domain_flex_parse_local_date("not-a-date") is None
+    assert domain_flex_parse_local_date("not-a-date") is None
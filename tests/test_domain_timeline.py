@@ -0,0 +1,48 @@
+"""Regression tests for shared stage timeline event helpers."""
+
+import json
+from datetime import datetime, timezone
+
+from app.domain import domain_build_stage_event
+
+
+def test_domain_build_stage_event_reuses_caller_supplied_timestamp() -> None:
+    """Use caller-supplied timestamp and keep optional details contract.
+
+    Returns:
+        None: Assertions validate timeline event payload shape.
+
+    Raises:
+        AssertionError: Raised when event payload diverges from contract.
+    """
+
+    at_utc = datetime(2026, 2, 14, 10, 0, tzinfo=timezone.utc)
+
+    first_event = domain_build_stage_event(stage="preflight", status="failed", details={"a": 1}, at_utc=at_utc)
+    second_event = domain_build_stage_event(stage="run", status="failed", at_utc=at_utc)
+
+    assert first_event == {
+        "stage": "preflight",
+        "status": "failed",
+        "at_utc": "2026-02-14T10:00:00+00:00",
+        "details": {"a": 1},
+    }
+    assert second_event == {"stage": "run", "status": "failed", "at_utc": "2026-02-14T10:00:00+00:00"}
+
+
+def test_domain_build_stage_event_round_trips_through_json() -> None:
+    """Serialize stage events to diagnostics JSON without conversion hooks.
+
+    Returns:
+        None: Assertions validate persisted timeline payload shape.
+
+    Raises:
+        AssertionError: Raised when event payload is not plain JSON data.
+    """
+
+    timeline = [
+        domain_build_stage_event(stage="run", status="started"),
+        domain_build_stage_event(stage="persist", status="completed", details={"raw_record_count": 3}),
+    ]
+
+    assert json.loads(json.dumps(timeline)) == timeline
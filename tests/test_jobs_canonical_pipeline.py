@@ -23,27 +23,32 @@ class _CanonicalPipelineRepositoryStub:
         """
 
         self.instrument_upsert_calls = 0
+        self.instrument_bulk_upsert_calls = 0
         self.bulk_upsert_calls = 0
 
-    def db_canonical_instrument_upsert(self, request):
-        """Capture instrument upsert invocation and return deterministic identity.
+    def db_canonical_instruments_bulk_upsert(self, requests):
+        """Capture batched instrument upsert invocation and return deterministic identities.
 
         Args:
-            request: Canonical instrument upsert request.
+            requests: Canonical instrument upsert requests.
 
         Returns:
-            object: Minimal instrument record object.
+            list[object]: Minimal instrument record objects.
 
         Raises:
             RuntimeError: This stub does not raise runtime errors.
         """
 
-        self.instrument_upsert_calls += 1
-        return type(
-            "InstrumentRecord",
-            (),
-            {"instrument_id": uuid4(), "account_id": request.account_id, "conid": request.conid},
-        )()
+        self.instrument_bulk_upsert_calls += 1
+        self.instrument_upsert_calls += len(requests)
+        return [
+            type(
+                "InstrumentRecord",
+                (),
+                {"instrument_id": uuid4(), "account_id": request.account_id, "conid": request.conid},
+            )()
+            for request in requests
+        ]
 
     def db_canonical_bulk_upsert(self, trade_requests, cashflow_requests, fx_requests, corp_action_requests) -> None:
         """Capture bulk upsert invocation.
@@ -130,6 +135,7 @@ def test_jobs_canonical_pipeline_reports_unique_instrument_upsert_count() -> Non
     )
 
     assert repository_stub.bulk_upsert_calls == 1
+    assert repository_stub.instrument_bulk_upsert_calls == 1
     assert repository_stub.instrument_upsert_calls == 1
     assert result_counts["instrument_upsert_count"] == 1
     assert result_counts["trade_fill_count"] == 2
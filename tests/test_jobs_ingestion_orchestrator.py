@@ -5,14 +5,18 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
+import pytest
+
 from app.adapters import AdapterFetchResult, FlexTokenInvalidError
 from app.db.interfaces import (
+    IngestionRunAlreadyActiveError,
     IngestionRunRecord,
     IngestionRunReference,
     IngestionRunState,
     RawArtifactPersistResult,
     RawArtifactRecord,
     RawArtifactReference,
+    RawArtifactWithRecordsPersistResult,
     RawRecordPersistResult,
 )
 from app.jobs import IngestionJobOrchestrator, IngestionOrchestratorConfig
@@ -32,6 +36,7 @@ class _RepositoryStub:
         """
 
         self.created_run = self._build_started_record()
+        self.created_period_keys: list[str] = []
         self.finalize_calls: list[dict[str, object]] = []
 
     def db_ingestion_run_create_started(
@@ -58,7 +63,8 @@ class _RepositoryStub:
             RuntimeError: This stub does not raise runtime errors.
         """
 
-        _ = (account_id, run_type, period_key, flex_query_id, report_date_local)
+        _ = (account_id, run_type, flex_query_id, report_date_local)
+        self.created_period_keys.append(period_key)
         return self.created_run
 
     def db_ingestion_run_finalize(
@@ -209,6 +215,7 @@ class _RawPersistenceStub:
         """
 
         self.raw_artifact_id = uuid4()
+        self.persist_calls = 0
 
     def db_raw_artifact_upsert(self, request) -> RawArtifactPersistResult:
         """Return deterministic artifact upsert result.
@@ -255,6 +262,27 @@ class _RawPersistenceStub:
 
         return RawRecordPersistResult(inserted_count=len(requests), deduplicated_count=0)
 
+    def db_raw_persist_artifact_and_records(self, artifact_request, record_drafts) -> RawArtifactWithRecordsPersistResult:
+        """Return deterministic combined artifact and raw row persistence result.
+
+        Args:
+            artifact_request: Raw artifact persist request.
+            record_drafts: Raw rows belonging to the artifact.
+
+        Returns:
+            RawArtifactWithRecordsPersistResult: Deterministic artifact result and row counters.
+
+        Raises:
+            RuntimeError: This stub does not raise runtime errors.
+        """
+
+        self.persist_calls += 1
+        record_drafts = list(record_drafts)
+        return RawArtifactWithRecordsPersistResult(
+            artifact_result=self.db_raw_artifact_upsert(artifact_request),
+            record_result=RawRecordPersistResult(inserted_count=len(record_drafts), deduplicated_count=0),
+        )
+
 
 class _SnapshotServiceStub:  # pylint: disable=too-few-public-methods
     """Snapshot service stub capturing automatic snapshot execution calls."""
@@ -310,9 +338,14 @@ class _SnapshotServiceStub:  # pylint: disable=too-few-public-methods
         )()
 
 
-def test_jobs_ingestion_orchestrator_marks_failed_on_missing_required_sections() -> None:
+def test_jobs_ingestion_orchestrator_marks_failed_on_missing_required_sections(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Finalize ingestion run as failed on required-section preflight failure.
 
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+
     Returns:
         None: Assertions validate behavior.
 
@@ -334,11 +367,31 @@ def test_jobs_ingestion_orchestrator_marks_failed_on_missing_required_sections()
         config=IngestionOrchestratorConfig(account_id="U_TEST", flex_query_id="query"),
     )
 
+    build_row_calls: list[object] = []
+    monkeypatch.setattr(
+        "app.jobs.ingestion_orchestrator.job_raw_build_payload_rows",
+        build_row_calls.append,
+    )
+
     result = orchestrator.job_execute(job_name="ingestion_run")
 
     assert result.status == "failed"
+    assert build_row_calls == []
     assert repository_stub.finalize_calls[0]["status"] == "failed"
     assert repository_stub.finalize_calls[0]["error_code"] == "MISSING_REQUIRED_SECTION"
+    assert len(repository_stub.finalize_calls) == 1
+    assert raw_persistence_stub.persist_calls == 0
+    preflight_failed_events = [
+        event
+        for event in repository_stub.finalize_calls[0]["diagnostics"]
+        if event.get("stage") == "preflight" and event.get("status") == "failed"
+    ]
+    assert len(preflight_failed_events) == 2
+    assert "OpenPositions" in preflight_failed_events[0]["details"]["missing_hard_required"]
+    assert (
+        preflight_failed_events[0]["details"]["missing_hard_required"]
+        == preflight_failed_events[1]["missing_hard_required"]
+    )
 
 
 def test_jobs_ingestion_orchestrator_marks_success_with_stage_timeline() -> None:
@@ -371,6 +424,9 @@ def test_jobs_ingestion_orchestrator_marks_success_with_stage_timeline() -> None
 
     assert result.status == "success"
     assert repository_stub.finalize_calls[0]["status"] == "success"
+    run_started_event = repository_stub.finalize_calls[0]["diagnostics"][0]
+    assert run_started_event["stage"] == "run" and run_started_event["status"] == "started"
+    assert repository_stub.created_period_keys == [str(run_started_event["at_utc"])[:10]]
 
 
 def test_jobs_ingestion_orchestrator_runs_snapshot_stage_on_success() -> None:
@@ -411,6 +467,41 @@ def test_jobs_ingestion_orchestrator_runs_snapshot_stage_on_success() -> None:
     assert snapshot_timeline_events[-1]["status"] == "completed"
 
 
+def test_jobs_ingestion_orchestrator_skips_flex_fetch_when_run_already_active() -> None:
+    """Never call the Flex adapter when the started run cannot be created.
+
+    Returns:
+        None: Assertions validate create-before-fetch ordering.
+
+    Raises:
+        AssertionError: Raised when adapter is invoked for a rejected run.
+    """
+
+    class _ActiveRunRepositoryStub(_RepositoryStub):
+        def db_ingestion_run_create_started(self, account_id, run_type, period_key, flex_query_id, report_date_local):
+            _ = (account_id, run_type, period_key, flex_query_id, report_date_local)
+            raise IngestionRunAlreadyActiveError("run already active")
+
+    class _RecordingAdapterStub(_AdapterStub):
+        fetch_calls = 0
+
+        def adapter_fetch_report(self, query_id: str) -> AdapterFetchResult:
+            _RecordingAdapterStub.fetch_calls += 1
+            return super().adapter_fetch_report(query_id=query_id)
+
+    orchestrator = IngestionJobOrchestrator(
+        ingestion_repository=_ActiveRunRepositoryStub(),
+        raw_persistence_repository=_RawPersistenceStub(),
+        flex_adapter=_RecordingAdapterStub(payload_bytes=b"<FlexQueryResponse />"),
+        config=IngestionOrchestratorConfig(account_id="U_TEST", flex_query_id="query"),
+    )
+
+    with pytest.raises(IngestionRunAlreadyActiveError):
+        orchestrator.job_execute(job_name="ingestion_run")
+
+    assert _RecordingAdapterStub.fetch_calls == 0
+
+
 def test_jobs_ingestion_orchestrator_returns_failed_result_on_adapter_timeout() -> None:
     """Return failed result and finalize diagnostics when adapter times out.
 
@@ -452,6 +543,7 @@ def test_jobs_ingestion_orchestrator_returns_failed_result_on_adapter_timeout()
     assert isinstance(diagnostics, list)
     failed_run_events = [event for event in diagnostics if event.get("stage") == "run" and event.get("status") == "failed"]
     assert len(failed_run_events) == 1
+    assert failed_run_events[0]["details"] == {"error_type": "TimeoutError", "error_message": "upstream timeout"}
 
 
 def test_jobs_ingestion_orchestrator_maps_typed_token_error_to_deterministic_code() -> None:
@@ -492,6 +584,37 @@ def test_jobs_ingestion_orchestrator_maps_typed_token_error_to_deterministic_cod
     assert repository_stub.finalize_calls[0]["error_code"] == "INGESTION_TOKEN_INVALID_ERROR"
 
 
+def test_jobs_ingestion_orchestrator_keeps_traceback_for_contract_errors() -> None:
+    """Attach the stack trace only when the failure points at application code.
+
+    Returns:
+        None: Assertions validate failure diagnostics detail shape.
+
+    Raises:
+        AssertionError: Raised when contract failures lose their traceback.
+    """
+
+    class _ContractErrorAdapterStub(_AdapterStub):
+        def adapter_fetch_report(self, query_id: str) -> AdapterFetchResult:
+            _ = query_id
+            raise ValueError("unexpected payload contract")
+
+    repository_stub = _RepositoryStub()
+    orchestrator = IngestionJobOrchestrator(
+        ingestion_repository=repository_stub,
+        raw_persistence_repository=_RawPersistenceStub(),
+        flex_adapter=_ContractErrorAdapterStub(payload_bytes=b""),
+        config=IngestionOrchestratorConfig(account_id="U_TEST", flex_query_id="query"),
+    )
+
+    result = orchestrator.job_execute(job_name="ingestion_run")
+
+    assert result.status == "failed"
+    assert repository_stub.finalize_calls[0]["error_code"] == "INGESTION_CONTRACT_ERROR"
+    failed_run_event = repository_stub.finalize_calls[0]["diagnostics"][-1]
+    assert "ValueError: unexpected payload contract" in failed_run_event["details"]["traceback"]
+
+
 def test_jobs_ingestion_orchestrator_persist_stage_contains_raw_persistence_details() -> None:
     """Require persist-stage diagnostics to include concrete raw persistence data.
 
@@ -625,20 +748,23 @@ class _CanonicalRepositoryStub:
             )()
         ]
 
-    def db_canonical_instrument_upsert(self, request):
-        """Return deterministic instrument record.
+    def db_canonical_instruments_bulk_upsert(self, requests):
+        """Return deterministic instrument records for batched upsert requests.
 
         Args:
-            request: Canonical instrument upsert request.
+            requests: Canonical instrument upsert requests.
 
         Returns:
-            object: Minimal instrument identity.
+            list[object]: Lightweight instrument record objects.
 
         Raises:
             RuntimeError: This stub does not raise runtime errors.
         """
 
-        return type("InstrumentRecord", (), {"instrument_id": uuid4(), "account_id": request.account_id, "conid": request.conid})()
+        return [
+            type("InstrumentRecord", (), {"instrument_id": uuid4(), "account_id": request.account_id, "conid": request.conid})()
+            for request in requests
+        ]
 
     def db_canonical_bulk_upsert(self, trade_requests, cashflow_requests, fx_requests, corp_action_requests) -> None:
         """Accept bulk canonical requests without side effects.
@@ -2,7 +2,11 @@
 
 from datetime import date
 
-from app.jobs.raw_extraction import job_raw_extract_payload_rows
+from app.jobs.raw_extraction import (
+    job_raw_build_payload_rows,
+    job_raw_scan_payload_section_names,
+    job_raw_scan_payload_sections,
+)
 
 
 def test_jobs_raw_extraction_extracts_section_names_and_source_refs() -> None:
@@ -23,7 +27,7 @@ def test_jobs_raw_extraction_extracts_section_names_and_source_refs() -> None:
         b"<OpenPositions /></FlexStatement></FlexStatements></FlexQueryResponse>"
     )
 
-    extraction_result = job_raw_extract_payload_rows(payload_bytes=payload_bytes)
+    extraction_result = job_raw_build_payload_rows(job_raw_scan_payload_sections(payload_bytes=payload_bytes))
 
     assert extraction_result.report_date_local == date(2026, 2, 14)
     assert len(extraction_result.rows) == 3
@@ -53,7 +57,7 @@ def test_jobs_raw_extraction_extracts_nested_section_rows() -> None:
         b"</FlexStatement></FlexStatements></FlexQueryResponse>"
     )
 
-    extraction_result = job_raw_extract_payload_rows(payload_bytes=payload_bytes)
+    extraction_result = job_raw_build_payload_rows(job_raw_scan_payload_sections(payload_bytes=payload_bytes))
 
     assert len(extraction_result.rows) == 2
     assert extraction_result.rows[0].section_name == "FxPositions"
@@ -81,7 +85,7 @@ def test_jobs_raw_extraction_preserves_parent_context_for_nested_leaf_rows() ->
         b"</FlexStatement></FlexStatements></FlexQueryResponse>"
     )
 
-    extraction_result = job_raw_extract_payload_rows(payload_bytes=payload_bytes)
+    extraction_result = job_raw_build_payload_rows(job_raw_scan_payload_sections(payload_bytes=payload_bytes))
 
     assert len(extraction_result.rows) == 1
     assert extraction_result.rows[0].section_name == "Trades"
@@ -111,7 +115,96 @@ def test_jobs_raw_extraction_rejects_mismatched_flex_statements_count() -> None:
     )
 
     try:
-        job_raw_extract_payload_rows(payload_bytes=payload_bytes)
+        job_raw_scan_payload_sections(payload_bytes=payload_bytes)
         assert False, "expected ValueError for mismatched FlexStatements count"
     except ValueError as error:
         assert "FlexStatements count attribute does not match" in str(error)
+
+
+def test_jobs_raw_extraction_scan_defers_row_building() -> None:
+    """Report section names from the scan before any raw row is built.
+
+    Returns:
+        None: Assertions validate scan and row-building split.
+
+    Raises:
+        AssertionError: Raised when scan output diverges from built rows.
+    """
+
+    payload_bytes = (
+        b"<FlexQueryResponse><FlexStatements count=\"1\">"
+        b"<FlexStatement accountId=\"U_TEST\" toDate=\"20260214\">"
+        b"<Trades><Trade transactionID=\"TX100\" quantity=\"10\" /></Trades>"
+        b"<OpenPositions /></FlexStatement></FlexStatements></FlexQueryResponse>"
+    )
+
+    section_scan = job_raw_scan_payload_sections(payload_bytes=payload_bytes)
+
+    assert section_scan.section_names == {"Trades", "OpenPositions"}
+    assert section_scan.report_date_local == date(2026, 2, 14)
+    assert len(section_scan.pending_rows) == 2
+
+    extraction_result = job_raw_build_payload_rows(section_scan)
+
+    assert extraction_result.report_date_local == date(2026, 2, 14)
+    assert [row.source_row_ref for row in extraction_result.rows] == [
+        "Trades:Trade:transactionID=TX100",
+        "OpenPositions:section:1",
+    ]
+
+
+def test_jobs_raw_extraction_ignores_root_flex_statement_element() -> None:
+    """Only count `FlexStatement` descendants, never the payload root itself.
+
+    Returns:
+        None: Assertions validate statement discovery scope.
+
+    Raises:
+        AssertionError: Raised when the root element is treated as a statement.
+    """
+
+    root_only_payload = b"<FlexStatement><Trades><Trade transactionID=\"TX100\" /></Trades></FlexStatement>"
+    nested_payload = b"<FlexStatement><FlexStatement><Trades /></FlexStatement></FlexStatement>"
+
+    try:
+        job_raw_scan_payload_sections(payload_bytes=root_only_payload)
+        assert False, "expected ValueError for payload without nested FlexStatement"
+    except ValueError as error:
+        assert "FlexStatement node not found" in str(error)
+
+    extraction_result = job_raw_build_payload_rows(job_raw_scan_payload_sections(payload_bytes=nested_payload))
+    assert [row.source_row_ref for row in extraction_result.rows] == ["Trades:section:1"]
+
+
+def test_jobs_raw_extraction_extracts_rows_for_nested_statements() -> None:
+    """Extract rows for every statement, including statements nested in another statement's section.
+
+    Returns:
+        None: Assertions validate nested statement extraction.
+
+    Raises:
+        AssertionError: Raised when nested statement rows or sections are missed.
+    """
+
+    payload_bytes = (
+        b"<FlexQueryResponse><FlexStatements count=\"2\">"
+        b"<FlexStatement accountId=\"U_OUTER\" reportDate=\"2026-02-14\">"
+        b"<Trades currency=\"USD\"><Order id=\"O1\"><Trade quantity=\"5\" /></Order>"
+        b"<FlexStatement accountId=\"U_INNER\"><CashTransactions><CashTransaction id=\"C1\" />"
+        b"</CashTransactions></FlexStatement></Trades>"
+        b"<OpenPositions /></FlexStatement></FlexStatements></FlexQueryResponse>"
+    )
+
+    section_scan = job_raw_scan_payload_sections(payload_bytes=payload_bytes)
+    extraction_result = job_raw_build_payload_rows(section_scan)
+
+    assert section_scan.section_names == {"Trades", "OpenPositions", "CashTransactions"}
+    assert job_raw_scan_payload_section_names(payload_bytes=payload_bytes) == section_scan.section_names
+    assert extraction_result.report_date_local == date(2026, 2, 14)
+    assert [row.source_row_ref for row in extraction_result.rows] == [
+        "Trades:Trade:id=O1",
+        "Trades:CashTransaction:id=C1",
+        "OpenPositions:section:1",
+        "CashTransactions:CashTransaction:id=C1",
+    ]
+    assert extraction_result.rows[0].source_payload == {"currency": "USD", "id": "O1", "quantity": "5"}
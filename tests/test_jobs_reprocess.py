@@ -79,20 +79,23 @@ class _CanonicalPersistRepositoryStub:
         self.upserted_trade_exec_ids: list[str] = []
         self.trade_instrument_ids: list[str] = []
 
-    def db_canonical_instrument_upsert(self, request):
-        """Return deterministic instrument record for each upsert request.
+    def db_canonical_instruments_bulk_upsert(self, requests):
+        """Return deterministic instrument records for batched upsert requests.
 
         Args:
-            request: Canonical instrument upsert request.
+            requests: Canonical instrument upsert requests.
 
         Returns:
-            object: Lightweight instrument record object.
+            list[object]: Lightweight instrument record objects.
 
         Raises:
             RuntimeError: This stub does not raise runtime errors.
         """
 
-        return type("InstrumentRecord", (), {"instrument_id": uuid4(), "account_id": request.account_id, "conid": request.conid})()
+        return [
+            type("InstrumentRecord", (), {"instrument_id": uuid4(), "account_id": request.account_id, "conid": request.conid})()
+            for request in requests
+        ]
 
     def db_canonical_trade_fill_upsert(self, request) -> None:
         """Capture upserted trade execution ids.
@@ -504,3 +507,5 @@ def test_jobs_reprocess_maps_typed_statement_error_to_deterministic_code() -> No
 
     assert result.status == "failed"
     assert ingestion_repository.finalize_calls[0]["error_code"] == "REPROCESS_STATEMENT_ERROR"
+    failed_event = ingestion_repository.finalize_calls[0]["diagnostics"][-1]
+    assert failed_event["at_utc"] == failed_event["details"]["failed_at_utc"]
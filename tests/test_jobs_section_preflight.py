@@ -1,8 +1,12 @@
 """Regression tests for section preflight required-section validation."""
 
+import json
+
 from app.jobs import (
     MISSING_REQUIRED_SECTION_CODE,
+    job_extract_missing_sections_from_diagnostics,
     job_section_preflight_build_missing_required_diagnostics,
+    job_section_preflight_extract_section_names,
     job_section_preflight_validate_required_sections,
 )
 
@@ -34,6 +38,55 @@ def test_jobs_section_preflight_reports_missing_required_sections() -> None:
     assert "OpenPositions" in diagnostics[0]["missing_sections"]
 
 
+def test_jobs_extract_missing_sections_uses_first_matching_diagnostics_event() -> None:
+    """Extract missing sections from the first matching event and default to empty lists.
+
+    Returns:
+        None: Assertions validate behavior.
+
+    Raises:
+        AssertionError: Raised when extraction output is unexpected.
+    """
+
+    diagnostics = [
+        "not-an-event",
+        {"stage": "preflight", "status": "started"},
+        {"error_code": MISSING_REQUIRED_SECTION_CODE, "missing_sections": ["Trades"], "missing_hard_required": ["Trades"]},
+        {"error_code": MISSING_REQUIRED_SECTION_CODE, "missing_sections": ["OpenPositions"]},
+    ]
+
+    extracted = job_extract_missing_sections_from_diagnostics(diagnostics=diagnostics)
+
+    assert extracted == {
+        "missing_sections": ["Trades"],
+        "missing_hard_required": ["Trades"],
+        "missing_reconciliation_required": [],
+    }
+    assert job_extract_missing_sections_from_diagnostics(diagnostics=None) == {
+        "missing_sections": [],
+        "missing_hard_required": [],
+        "missing_reconciliation_required": [],
+    }
+
+
+def test_jobs_extract_missing_sections_matches_json_decoded_error_codes() -> None:
+    """Match error codes by value for diagnostics decoded from persisted JSON.
+
+    Returns:
+        None: Assertions validate behavior.
+
+    Raises:
+        AssertionError: Raised when decoded codes are not matched.
+    """
+
+    diagnostics = json.loads(
+        json.dumps([{"error_code": MISSING_REQUIRED_SECTION_CODE, "missing_sections": ["Trades"]}])
+    )
+
+    assert diagnostics[0]["error_code"] is not MISSING_REQUIRED_SECTION_CODE
+    assert job_extract_missing_sections_from_diagnostics(diagnostics=diagnostics)["missing_sections"] == ["Trades"]
+
+
 def test_jobs_section_preflight_rejects_mismatched_flex_statements_count() -> None:
     """Reject preflight payloads when FlexStatements count mismatches statement nodes.
 
@@ -55,3 +108,59 @@ def test_jobs_section_preflight_rejects_mismatched_flex_statements_count() -> No
         assert False, "expected ValueError for mismatched FlexStatements count"
     except ValueError as error:
         assert "FlexStatements count attribute does not match" in str(error)
+
+
+def test_jobs_section_preflight_extracts_direct_statement_children_only() -> None:
+    """Collect only direct children of every statement, including nested statements.
+
+    Returns:
+        None: Assertions validate detected section names.
+
+    Raises:
+        AssertionError: Raised when nested rows leak into section names.
+    """
+
+    payload = (
+        b"<FlexQueryResponse><FlexStatements count=\"2\">"
+        b"<FlexStatement><Trades><Trade /></Trades>"
+        b"<Wrapper><FlexStatement><CashTransactions><CashTransaction /></CashTransactions></FlexStatement></Wrapper>"
+        b"</FlexStatement>"
+        b"</FlexStatements></FlexQueryResponse>"
+    )
+
+    assert job_section_preflight_extract_section_names(payload_bytes=payload) == {
+        "Trades",
+        "Wrapper",
+        "CashTransactions",
+    }
+
+
+def test_jobs_extract_missing_sections_normalizes_non_string_values() -> None:
+    """Stringify non-string section values and keep known section names unchanged.
+
+    Returns:
+        None: Assertions validate extracted section-name lists.
+
+    Raises:
+        AssertionError: Raised when section-name normalization changes values.
+    """
+
+    diagnostics = json.loads(
+        json.dumps(
+            [
+                {
+                    "error_code": MISSING_REQUIRED_SECTION_CODE,
+                    "missing_sections": ["Trades", 7],
+                    "missing_hard_required": ["Trades"],
+                }
+            ]
+        )
+    )
+
+    extracted = job_extract_missing_sections_from_diagnostics(diagnostics)
+
+    assert extracted == {
+        "missing_sections": ["Trades", "7"],
+        "missing_hard_required": ["Trades"],
+        "missing_reconciliation_required": [],
+    }
@@ -6,6 +6,8 @@ from datetime import datetime
 from decimal import Decimal
 from zoneinfo import ZoneInfo
 
+import pytest
+
 from app.ledger.fifo_engine import FifoLedgerComputationRequest, FifoTradeFillInput, fifo_compute_instrument
 from app.ledger.snapshot_dates import snapshot_resolve_report_date_local
 
@@ -258,6 +260,39 @@ def test_ledger_fifo_supports_short_open_and_partial_cover() -> None:
     assert result.open_lots[0].remaining_quantity == Decimal("-3")
 
 
+def test_ledger_fifo_rejects_offset_naive_timestamps_on_every_run() -> None:
+    """Keep rejecting naive fill timestamps when the same value is computed again.
+
+    Returns:
+        None: Assertions validate repeated timestamp validation.
+
+    Raises:
+        AssertionError: Raised when a failed timestamp parse is served from the memo.
+    """
+
+    request = FifoLedgerComputationRequest(
+        account_id="U_TEST",
+        instrument_id="instrument-6",
+        functional_currency="USD",
+        mark_price=Decimal("100"),
+        trades=[
+            FifoTradeFillInput(
+                source_raw_record_id="00000000-0000-0000-0000-000000000600",
+                trade_timestamp_utc="2026-02-10T10:00:00",
+                side="BUY",
+                quantity=Decimal("1"),
+                price=Decimal("100"),
+                fees=None,
+                withholding_tax=None,
+            ),
+        ],
+    )
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="offset-aware"):
+            fifo_compute_instrument(request)
+
+
 def test_snapshot_report_date_uses_asia_jerusalem_timezone_across_dst_edges() -> None:
     """Resolve report date in Asia/Jerusalem from UTC timestamps for DST-edge instants.
 